@@ -5,15 +5,46 @@ Loads configuration from environment variables and .env files.
 Provides centralized access to all application settings.
 """
 
+import hashlib
+import hmac
 import os
 from typing import Any, Optional
 
 
+PASSWORD_HASH_ITERATIONS = 100_000
+
+
 def str_to_bool(value: str) -> bool:
     """Convert string to boolean."""
     return value.lower() in ('true', '1', 'yes', 'on', 'enabled')
 
 
+def hash_password(password: str, salt: Optional[bytes] = None,
+                  iterations: int = PASSWORD_HASH_ITERATIONS) -> str:
+    """
+    Hash a password for GATEWISE_ADMIN_PASSWORD_HASH.
+    
+    Returns:
+        "pbkdf2_sha256$<iterations>$<salt hex>$<hash hex>"
+    """
+    salt = salt or os.urandom(16)
+    digest = hashlib.pbkdf2_hmac('sha256', password.encode('utf-8'), salt, iterations)
+    return f"pbkdf2_sha256${iterations}${salt.hex()}${digest.hex()}"
+
+
+def verify_password(password: str, stored_hash: str) -> bool:
+    """Check a password against a hash_password() string in constant time."""
+    try:
+        scheme, iterations, salt, expected = stored_hash.split('$')
+        if scheme != 'pbkdf2_sha256':
+            return False
+        digest = hashlib.pbkdf2_hmac('sha256', password.encode('utf-8'),
+                                     bytes.fromhex(salt), int(iterations))
+        return hmac.compare_digest(digest, bytes.fromhex(expected))
+    except ValueError:
+        return False
+
+
 class Config:
     """Application configuration loader and manager."""
     
@@ -43,11 +74,14 @@ class Config:
     def _load_settings(self):
         """Load all configuration settings from environment."""
         # Security
+        self.admin_password_hash = os.environ.get('GATEWISE_ADMIN_PASSWORD_HASH', '')
         self.admin_password = os.environ.get('GATEWISE_ADMIN_PASSWORD', None)
-        if not self.admin_password:
+        if not self.admin_password and not self.admin_password_hash:
             print("[WARNING] GATEWISE_ADMIN_PASSWORD not set! Using insecure default.")
             print("[WARNING] Set environment variable GATEWISE_ADMIN_PASSWORD for security!")
             self.admin_password = 'admin'  # Fallback for development only
+        # Minutes a correct admin password stays valid before it is asked for again
+        self.auth_session_minutes = int(os.environ.get('AUTH_SESSION_MINUTES', '15'))
         
         # Garage Door Settings
         self.garage_enabled = str_to_bool(os.environ.get('GARAGE_ENABLED', 'false'))
@@ -59,6 +93,7 @@ class Config:
         self.garage_sensor_pin = int(self.garage_sensor_pin) if self.garage_sensor_pin else None
         self.garage_sensor_active_low = str_to_bool(os.environ.get('GARAGE_SENSOR_ACTIVE_LOW', 'true'))
         self.garage_auto_close_seconds = int(os.environ.get('GARAGE_AUTO_CLOSE_SECONDS', '0'))
+        self.garage_confirm = str_to_bool(os.environ.get('GARAGE_CONFIRM', 'false'))
         
         # RFID Settings
         self.rfid_enabled = str_to_bool(os.environ.get('RFID_ENABLED', 'true'))
@@ -89,9 +124,21 @@ class Config:
         self.users_file = os.environ.get('USERS_FILE', 'users.json')
         self.blackout_file = os.environ.get('BLACKOUT_FILE', 'blackout.json')
         self.garage_state_file = os.environ.get('GARAGE_STATE_FILE', 'garage_state.json')
+        self.pretty_json = str_to_bool(os.environ.get('PRETTY_JSON', 'true'))
         self.auto_backup_hours = int(os.environ.get('AUTO_BACKUP_HOURS', '0'))
         self.backup_dir = os.environ.get('BACKUP_DIR', 'backups')
     
+    def check_admin_password(self, password: str) -> bool:
+        """
+        Check an entered admin password.
+        
+        Uses GATEWISE_ADMIN_PASSWORD_HASH when set, otherwise the plain
+        GATEWISE_ADMIN_PASSWORD; both comparisons are constant-time.
+        """
+        if self.admin_password_hash:
+            return verify_password(password, self.admin_password_hash)
+        return hmac.compare_digest(password.encode('utf-8'), (self.admin_password or '').encode('utf-8'))
+    
     def get(self, key: str, default: Any = None) -> Any:
         """Get configuration value by key."""
         return getattr(self, key, default)
@@ -110,7 +157,10 @@ class Config:
         print("=" * 60)
         print("GateWise Configuration")
         print("=" * 60)
-        print(f"Admin Password: {'SET' if self.admin_password != 'admin' else 'NOT SET (USING DEFAULT!)'}")
+        if self.admin_password_hash:
+            print("Admin Password: SET (hashed)")
+        else:
+            print(f"Admin Password: {'SET' if self.admin_password != 'admin' else 'NOT SET (USING DEFAULT!)'}")
         print(f"Garage Enabled: {self.garage_enabled}")
         if self.garage_enabled:
             print(f"  Relay Pin: GPIO{self.garage_relay_pin}")
@@ -142,6 +192,8 @@ def reload_config():
     global _config
     _config = Config()
     return _config
+
+
 """Simple config helpers used by the GateWise UI.
 
 These helpers are intentionally small and file-based so tests and the UI
@@ -168,3 +220,8 @@ def save_json(path, data):
 	with p.open('w', encoding='utf-8') as f:
 		json.dump(data, f, indent=4)
 
+
+if __name__ == '__main__':
+    # Print a GATEWISE_ADMIN_PASSWORD_HASH value: python -m core.config
+    import getpass
+    print(hash_password(getpass.getpass('Admin password: ')))
@@ -278,33 +278,39 @@ class GarageDoorController:
     def _load_state(self):
         """Load persisted state from file."""
         try:
-            if os.path.exists(self.config.garage_state_file):
-                with open(self.config.garage_state_file, "r") as f:
-                    state_data = json.load(f)
-                    self.current_state = state_data.get("state", GarageDoorState.UNKNOWN)
-                    self.last_trigger_time = state_data.get("last_trigger_time")
-                    print(f"[GARAGE] Loaded state: {self.current_state}")
+            with open(self.config.garage_state_file, "r") as f:
+                state_data = json.load(f)
+                self.current_state = state_data.get("state", GarageDoorState.UNKNOWN)
+                self.last_trigger_time = state_data.get("last_trigger_time")
+                print(f"[GARAGE] Loaded state: {self.current_state}")
+        except FileNotFoundError:
+            pass
         except Exception as e:
             print(f"[GARAGE ERROR] Failed to load state: {e}")
     
-    def get_recent_events(self, count: int = 10) -> list:
+    def get_recent_events(self, count: int = 10, with_seq: bool = False) -> list:
         """
         Get recent garage events from log.
         
         Args:
             count: Number of recent events to retrieve
+            with_seq: If True, return (seq, event) pairs where seq is the
+                event's 1-based line number in the log
         
         Returns:
-            List of recent event strings
+            List of recent event strings, or (seq, event) pairs
         """
         try:
             log_file = "garage_events.log"
-            if not os.path.exists(log_file):
-                return []
-            
             with open(log_file, "r") as f:
                 lines = f.readlines()
-                return [line.strip() for line in lines[-count:]]
+                recent = [line.strip() for line in lines[-count:]]
+                if with_seq:
+                    first = len(lines) - len(recent) + 1
+                    return list(enumerate(recent, first))
+                return recent
+        except FileNotFoundError:
+            return []
         except Exception as e:
             print(f"[GARAGE ERROR] Failed to read events: {e}")
             return []
@@ -3,30 +3,62 @@
 This module implements a tiny threaded TCP server that prints any JSON
 payloads it receives. It is not wired into the main UI by default — it is
 meant as a developer helper for testing `push_to_door_modules()`.
+
+Pushes arrive as a 1-byte tag and a 4-byte big-endian length followed by
+that many bytes of body; the UI keeps the connection open and sends one frame
+per push. Tag 0 is raw JSON, tag 1 is zlib-compressed JSON. Each frame is
+answered with a single byte: 0 when the JSON parsed, 1 when it did not.
 """
 import socketserver
 import json
+import struct
+import zlib
+
+FRAME_RAW = 0
+FRAME_ZLIB = 1
+ACK_OK = b'\x00'
+ACK_ERROR = b'\x01'
 
 
 class _Handler(socketserver.BaseRequestHandler):
-	def handle(self):
+	def _recv_exact(self, size):
 		data = b""
-		# Read until client closes
-		try:
-			while True:
-				chunk = self.request.recv(4096)
-				if not chunk:
+		while len(data) < size:
+			chunk = self.request.recv(size - len(data))
+			if not chunk:
+				return None
+			data += chunk
+		return data
+
+	def handle(self):
+		# Read frames until client closes
+		while True:
+			try:
+				header = self._recv_exact(5)
+				if header is None:
+					break
+				tag, length = struct.unpack('!BI', header)
+				data = self._recv_exact(length)
+				if data is None:
 					break
-				data += chunk
-		except Exception:
-			pass
+				if tag == FRAME_ZLIB:
+					data = zlib.decompress(data)
+			except Exception:
+				break
 
-		try:
-			text = data.decode('utf-8')
-			payload = json.loads(text)
-			print(f"[network_listener] Received payload from {self.client_address}: {payload}")
-		except Exception:
-			print(f"[network_listener] Received raw data from {self.client_address}: {data}")
+			try:
+				text = data.decode('utf-8')
+				payload = json.loads(text)
+				print(f"[network_listener] Received payload from {self.client_address}: {payload}")
+				ack = ACK_OK
+			except Exception:
+				print(f"[network_listener] Received raw data from {self.client_address}: {data}")
+				ack = ACK_ERROR
+
+			try:
+				self.request.sendall(ack)
+			except OSError:
+				break
 
 
 def start_server(host='0.0.0.0', port=5006):
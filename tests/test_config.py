@@ -9,7 +9,7 @@ import unittest
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from core.config import Config, get_config, str_to_bool
+from core.config import Config, get_config, hash_password, str_to_bool, verify_password
 
 
 class TestConfig(unittest.TestCase):
@@ -63,6 +63,21 @@ class TestConfig(unittest.TestCase):
         config = Config()
         self.assertEqual(config.admin_password, 'test_password_123')
     
+    def test_password_hash(self):
+        """Test hashed admin password verification."""
+        stored = hash_password('s3cret', iterations=1000)
+        self.assertTrue(stored.startswith('pbkdf2_sha256$1000$'))
+        self.assertTrue(verify_password('s3cret', stored))
+        self.assertFalse(verify_password('wrong', stored))
+        self.assertFalse(verify_password('s3cret', 'not-a-hash'))
+        
+        os.environ['GATEWISE_ADMIN_PASSWORD_HASH'] = stored
+        os.environ['GATEWISE_ADMIN_PASSWORD'] = 'plain'
+        config = Config()
+        # The hash takes precedence over the plain password
+        self.assertTrue(config.check_admin_password('s3cret'))
+        self.assertFalse(config.check_admin_password('plain'))
+    
     def test_garage_config(self):
         """Test garage configuration."""
         os.environ['GARAGE_ENABLED'] = 'true'
@@ -112,10 +112,12 @@ def test_user_persistence():
         shutil.rmtree(temp_dir)
 
 
-def test_ui_initialization():
+def test_ui_initialization(monkeypatch):
     """Test that UI initializes without errors."""
     from PyQt5.QtWidgets import QApplication
+    import ui.gatewise_ui as gw
     from ui.gatewise_ui import GateWiseUI
+    monkeypatch.setattr(gw.config, 'garage_enabled', True)
     
     # Get existing app or create new one
     app = QApplication.instance()
@@ -124,13 +126,23 @@ def test_ui_initialization():
     
     window = GateWiseUI()
     
-    # Check that all screens are initialized
+    # Only the main screen is built up front; the rest are built on first visit
     assert window.main_screen is not None
+    assert window.settings_screen is None
+    window.show_settings()
+    window.show_logs()
+    window.show_blackout()
+    window.show_user_management()
+    window.show_garage()
     assert window.settings_screen is not None
     assert window.log_screen is not None
     assert window.blackout_screen is not None
     assert window.user_screen is not None
     assert window.garage_screen is not None
+    assert window.stack.currentWidget() is window.garage_screen
+    # A second visit refreshes the already-built screen
+    window.show_main()
+    window.show_garage()
     
     # Check that garage controller is initialized
     assert window.garage_controller is not None
@@ -1,4 +1,10 @@
 import json
+import struct
+import zlib
+
+import pytest
+from PyQt5.QtCore import Qt
+from PyQt5.QtWidgets import QWidget
 
 import ui.gatewise_ui as gw
 from ui.gatewise_ui import GateWiseUI
@@ -32,7 +38,8 @@ def test_blackout_save_and_load(qtbot):
 
     ui2 = GateWiseUI()
     qtbot.addWidget(ui2)
-    # The second instance should load the file on init
+    # The second instance should load the file when the screen is first shown
+    ui2.show_blackout()
     assert len(ui2.blackout_blocks['Monday']) >= 1
 
 
@@ -54,6 +61,33 @@ def test_request_password_shows_settings(qtbot, monkeypatch):
     assert ui.stack.currentWidget() is ui.settings_screen
 
 
+def test_request_password_remembered_for_session(qtbot, monkeypatch):
+    opened = []
+
+    class FakeDlg:
+        def exec_(self):
+            opened.append(True)
+            return True
+
+        def get_password(self):
+            return 'admin'
+
+    monkeypatch.setattr(gw, 'PasswordDialog', lambda parent=None: FakeDlg())
+    ui = GateWiseUI()
+    qtbot.addWidget(ui)
+
+    ui.request_password()
+    ui.show_main()
+    ui.request_password()
+    assert opened == [True]
+    assert ui.stack.currentWidget() is ui.settings_screen
+
+    # Once the session lapses the password is asked for again
+    ui._auth_expiry = 0.0
+    ui.request_password()
+    assert opened == [True, True]
+
+
 def test_blackout_back_button_navigates_to_settings(qtbot):
     """Test that the back button in blackout screen navigates to settings screen."""
     ui = GateWiseUI()
@@ -140,3 +174,712 @@ def test_all_back_buttons_work_correctly(qtbot):
         back_btn.click()
         assert ui.stack.currentWidget() is ui.settings_screen
 
+
+
+def test_cached_json_load_tracks_file_changes():
+    with open('users.json', 'w') as f:
+        json.dump([{'uid': '1', 'name': 'A', 'isAdmin': False}], f)
+
+    first = gw._cached_json_load('users.json')
+    first[0]['name'] = 'mutated'
+    # Mutating a returned copy must not leak into the cache
+    assert gw._cached_json_load('users.json')[0]['name'] == 'A'
+
+    with open('users.json', 'w') as f:
+        json.dump([{'uid': '1', 'name': 'Alice B', 'isAdmin': True}], f)
+
+    assert gw._cached_json_load('users.json')[0]['name'] == 'Alice B'
+
+
+def test_door_push_worker_reports_per_host_result():
+    import socket
+    import threading
+
+    server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    server.bind(('127.0.0.1', 0))
+    server.listen(1)
+    port = server.getsockname()[1]
+    received = []
+
+    def _accept():
+        conn, _ = server.accept()
+        with conn:
+            received.append(conn.recv(4096))
+            conn.sendall(gw.FRAME_ACK_OK)
+
+    t = threading.Thread(target=_accept, daemon=True)
+    t.start()
+
+    # Second host refuses the connection on the same port
+    frame = gw._frame_payload(b'{"users": []}')
+    worker = gw.DoorPushWorker(['127.0.0.1', '127.0.0.2'], port)
+    results = []
+    worker.finished.connect(results.append)
+    try:
+        worker.submit(frame)
+        t.join(timeout=5)
+
+        assert results == [{'127.0.0.1': True, '127.0.0.2': False}]
+        assert received == [b'\x00\x00\x00\x00\r{"users": []}']
+        # The working connection is kept for the next push, the failed one is not
+        assert list(worker.conns) == ['127.0.0.1']
+        if hasattr(socket, 'TCP_USER_TIMEOUT'):
+            sock = worker.conns['127.0.0.1'][1].get_extra_info('socket')
+            assert sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_USER_TIMEOUT) == gw.DOOR_USER_TIMEOUT_MS
+    finally:
+        worker.close()
+        server.close()
+
+
+def test_send_to_host_waits_for_listener_ack():
+    import socketserver
+    import threading
+    from core import network_listener
+
+    server = socketserver.ThreadingTCPServer(('127.0.0.1', 0), network_listener._Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    port = server.server_address[1]
+    worker = gw.DoorPushWorker(['127.0.0.1'], port)
+    try:
+        assert worker.push(gw._frame_payload(b'{"users": []}')) == {'127.0.0.1': True}
+        # The listener NAKs a body that isn't JSON; the connection stays usable
+        assert worker.push(gw._frame_payload(b'not json')) == {'127.0.0.1': False}
+        stream = worker.conns['127.0.0.1']
+        assert worker.push(gw._frame_payload(b'{"users": []}')) == {'127.0.0.1': True}
+        assert worker.conns['127.0.0.1'] is stream
+    finally:
+        worker.close()
+        server.shutdown()
+        server.server_close()
+
+
+def test_send_gives_up_on_peer_that_stops_reading(monkeypatch):
+    import socket
+
+    # Accepted by the kernel but never read, so the send buffers fill and drain() stalls
+    server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    server.bind(('127.0.0.1', 0))
+    server.listen(4)
+    monkeypatch.setattr(gw, 'DOOR_SEND_TIMEOUT_S', 0.2)
+    monkeypatch.setattr(gw, 'DOOR_PUSH_BACKOFF_S', 0)
+    worker = gw.DoorPushWorker(['127.0.0.1'], server.getsockname()[1])
+    try:
+        frame = struct.pack('!BI', gw.FRAME_RAW, 16 << 20) + bytes(16 << 20)
+        assert worker.push(frame) == {'127.0.0.1': False}
+        assert worker.conns == {}
+    finally:
+        worker.close()
+        server.close()
+
+
+def test_door_push_worker_coalesces_waiting_frames(qtbot):
+    import threading
+    from PyQt5.QtCore import QThread
+
+    gate = threading.Event()
+    sent = []
+
+    def _push(frame):
+        sent.append(frame)
+        gate.wait(5)
+        return {}
+
+    worker = gw.DoorPushWorker([], 0)
+    worker.push = _push
+    thread = QThread()
+    worker.moveToThread(thread)
+    thread.start()
+    try:
+        worker.submit(b'a')
+        qtbot.waitUntil(lambda: sent == [b'a'], timeout=2000)
+        # While 'a' is in flight, 'b' is superseded before it is ever sent
+        worker.submit(b'b')
+        worker.submit(b'c')
+        gate.set()
+        qtbot.waitUntil(lambda: sent == [b'a', b'c'], timeout=2000)
+    finally:
+        gate.set()
+        thread.quit()
+        thread.wait(2000)
+        worker.close()
+
+
+def test_door_push_worker_stop_cancels_push_in_flight(qtbot):
+    import socket
+    import threading
+    from PyQt5.QtCore import QThread
+
+    # Accepts the frame but never acknowledges it
+    server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    server.bind(('127.0.0.1', 0))
+    server.listen(1)
+    accepted = threading.Event()
+    held = []
+
+    def _accept():
+        conn, _ = server.accept()
+        held.append(conn)
+        accepted.set()
+
+    threading.Thread(target=_accept, daemon=True).start()
+    worker = gw.DoorPushWorker(['127.0.0.1'], server.getsockname()[1])
+    results = []
+    worker.finished.connect(results.append)
+    thread = QThread()
+    worker.moveToThread(thread)
+    thread.start()
+    try:
+        worker.submit(gw._frame_payload(b'{"users": []}'))
+        assert accepted.wait(5)
+        worker.stop()
+        thread.quit()
+        # Well inside DOOR_ACK_TIMEOUT_S: the ACK wait was cancelled, not timed out
+        assert thread.wait(1000)
+        # A cancelled push reports nothing, so closing never pops up "Push Failed"
+        qtbot.wait(100)
+        assert results == []
+        assert worker.conns == {}
+    finally:
+        thread.quit()
+        thread.wait(2000)
+        worker.close()
+        for conn in held:
+            conn.close()
+        server.close()
+
+
+def test_rfid_worker_stop_abandons_wait_for_card():
+    import threading
+    from PyQt5.QtCore import QThread
+
+    polled = threading.Event()
+
+    class _NoCard:
+        def read_no_block(self):
+            polled.set()
+            return None, None
+
+    worker = gw.RfidWorker(_NoCard())
+    scanned = []
+    worker.uid_scanned.connect(scanned.append)
+    thread = QThread()
+    worker.moveToThread(thread)
+    thread.start()
+    worker.scan_requested.emit()
+    assert polled.wait(2)
+    worker.stop()
+    thread.quit()
+    assert thread.wait(1000)
+    assert scanned == []
+
+
+def test_join_thread_leaves_stuck_worker_running(monkeypatch):
+    import threading
+    from PyQt5.QtCore import QThread
+
+    release = threading.Event()
+    reading = threading.Event()
+
+    class _BlockingReader:
+        def read(self):
+            reading.set()
+            release.wait(5)
+            return '1', None
+
+    monkeypatch.setattr(gw, '_abandoned_threads', [])
+    worker = gw.RfidWorker(_BlockingReader())
+    thread = QThread()
+    worker.moveToThread(thread)
+    thread.start()
+    worker.scan_requested.emit()
+    assert reading.wait(2)
+    worker.stop()
+    thread.quit()
+    try:
+        assert not gw._join_thread(thread, worker, 50)
+        # Not terminated: still running, and kept alive until it finishes
+        assert thread.isRunning()
+        assert gw._abandoned_threads == [(thread, worker)]
+    finally:
+        release.set()
+        assert thread.wait(2000)
+
+
+def test_frame_payload_compresses_large_user_lists():
+    small = b'{"users": []}'
+    assert gw._frame_payload(small) == struct.pack('!BI', gw.FRAME_RAW, len(small)) + small
+
+    large = json.dumps({'users': [{'uid': str(i), 'name': 'User', 'isAdmin': False} for i in range(100)]}).encode()
+    frame = gw._frame_payload(large)
+    tag, length = struct.unpack('!BI', frame[:5])
+    assert tag == gw.FRAME_ZLIB
+    assert length == len(frame) - 5 < len(large)
+    assert zlib.decompress(frame[5:]) == large
+
+
+def test_refresh_user_list_patches_rows_in_place(qtbot):
+    ui = GateWiseUI()
+    qtbot.addWidget(ui)
+    ui.show_user_management()
+    model = ui.user_model
+    changed, removed, resets = [], [], []
+    model.dataChanged.connect(lambda top, bottom: changed.append(top.row()))
+    model.rowsRemoved.connect(lambda parent, first, last: removed.append(first))
+    model.modelReset.connect(lambda: resets.append(True))
+
+    ui.users = [
+        {'uid': '1', 'name': 'Alice', 'isAdmin': False},
+        {'uid': '2', 'name': 'Bob', 'isAdmin': True},
+    ]
+    ui.refresh_user_list()
+    assert model.rowCount() == 2
+
+    # Edit Bob, delete Alice: one row removed, Bob's row changed in place
+    ui.users = [{'uid': '2', 'name': 'Robert', 'isAdmin': True}]
+    ui.refresh_user_list()
+    assert model.rowCount() == 1
+    assert removed == [0] and changed == [0]
+    assert model.data(model.index(0), Qt.UserRole)['name'] == 'Robert'
+
+    # Editing the user dict in place is still picked up on the next refresh
+    ui.users[0]['isAdmin'] = False
+    ui.refresh_user_list()
+    assert model.data(model.index(0)) == 'UID: 2  Name: Robert  Admin: No'
+
+    # An unchanged refresh signals nothing
+    ui.refresh_user_list()
+    assert changed == [0, 0] and not resets
+
+    ui.users = [{'uid': '3', 'name': 'Carol', 'isAdmin': False}]
+    ui.refresh_user_list()
+    assert resets == [True]
+    assert model.data(model.index(0), Qt.UserRole)['uid'] == '3'
+
+
+def test_log_model_drops_oldest_entries():
+    model = gw.LogModel(maxlen=3)
+    removed = []
+    model.rowsRemoved.connect(lambda parent, first, last: removed.append(first))
+    for n in range(5):
+        model.append(f"entry {n}")
+    assert model.rowCount() == 3
+    assert removed == [0, 0]
+    assert [model.data(model.index(r)) for r in range(3)] == ["entry 2", "entry 3", "entry 4"]
+
+
+def test_log_entries_kept_before_log_screen_is_built(qtbot):
+    ui = GateWiseUI()
+    qtbot.addWidget(ui)
+    ui.add_log_entry("42  Alice")
+    ui.add_log_entry("99  Bob")
+
+    ui.show_logs()
+    model = ui.log_view.model()
+    assert model.rowCount() == 2
+    assert model.data(model.index(0)).endswith("42  Alice")
+    assert model.data(model.index(1)).endswith("99  Bob")
+
+
+def test_user_row_buttons_route_by_uid(qtbot, monkeypatch):
+    edited, deleted = [], []
+    monkeypatch.setattr(GateWiseUI, 'edit_user_dialog', lambda self, user: edited.append(user['uid']))
+    monkeypatch.setattr(GateWiseUI, 'delete_user', lambda self, user: deleted.append(user['uid']))
+    ui = GateWiseUI()
+    qtbot.addWidget(ui)
+    ui.show()
+    ui.show_user_management()
+    ui.users = [
+        {'uid': '1', 'name': 'Alice', 'isAdmin': False},
+        {'uid': '2', 'name': 'Bob', 'isAdmin': True},
+    ]
+    ui.refresh_user_list()
+
+    view = ui.user_list_view
+    edit_rect, delete_rect = view.itemDelegate()._button_rects(view.visualRect(ui.user_model.index(1)))
+    qtbot.mouseClick(view.viewport(), Qt.LeftButton, pos=edit_rect.center())
+    qtbot.mouseClick(view.viewport(), Qt.LeftButton, pos=delete_rect.center())
+    assert edited == ['2'] and deleted == ['2']
+
+
+def test_auto_sync_coalesces_rapid_saves(qtbot, monkeypatch):
+    pushes = []
+    monkeypatch.setattr(gw.GateWiseUI, 'push_to_door_modules', lambda self: pushes.append(list(self.users)))
+    ui = GateWiseUI()
+    qtbot.addWidget(ui)
+    ui.auto_sync_enabled = True
+
+    for i in range(3):
+        ui.users = [{'uid': str(i), 'name': 'User', 'isAdmin': False}]
+        ui.save_users()
+
+    assert pushes == []
+    qtbot.waitUntil(lambda: len(pushes) > 0, timeout=2000)
+    qtbot.wait(100)
+    assert pushes == [[{'uid': '2', 'name': 'User', 'isAdmin': False}]]
+
+
+def test_save_blackout_flashes_status_banner(qtbot):
+    ui = GateWiseUI()
+    qtbot.addWidget(ui)
+    ui.show()
+
+    ui.save_blackout_schedule()
+
+    assert ui.status_banner.isVisible()
+    assert 'saved' in ui.status_banner.text()
+    qtbot.waitUntil(lambda: not ui.status_banner.isVisible(), timeout=5000)
+
+
+class _FakeGarage:
+    def __init__(self):
+        self.last_trigger_time = None
+        self.state = 'closed'
+        self.events = ['[t1] Door triggered by ui']
+
+    def get_state(self):
+        return self.state
+
+    def get_recent_events(self, count=10, with_seq=False):
+        recent = self.events[-count:]
+        if with_seq:
+            return list(enumerate(recent, len(self.events) - len(recent) + 1))
+        return list(recent)
+
+    def cleanup(self):
+        pass
+
+
+def test_update_garage_status_only_redraws_on_change(qtbot):
+    ui = GateWiseUI()
+    qtbot.addWidget(ui)
+    ui.garage_controller = _FakeGarage()
+    ui._garage_enabled = True
+    ui.show_garage()
+
+    assert ui.garage_events_list.count() == 1
+    assert ui.garage_last_trigger_label.text() == 'Last triggered: Never'
+
+    # Unchanged controller state leaves the labels alone
+    ui.garage_status_label.setText('sentinel')
+    ui.update_garage_status()
+    assert ui.garage_status_label.text() == 'sentinel'
+
+    ui.garage_controller.state = 'open'
+    ui.garage_controller.events.append('[t2] Door state changed')
+    ui.update_garage_status()
+    assert ui.garage_status_label.text() == 'Status: OPEN'
+    texts = [ui.garage_events_list.item(i).text() for i in range(ui.garage_events_list.count())]
+    assert texts == ['[t2] Door state changed', '[t1] Door triggered by ui']
+
+
+def test_update_garage_status_prepends_new_events(qtbot):
+    ui = GateWiseUI()
+    qtbot.addWidget(ui)
+    ui.garage_controller = _FakeGarage()
+    ui.garage_controller.events = [f'[t{i}] event' for i in range(1, 21)]
+    ui._garage_enabled = True
+    ui.show_garage()
+    oldest_kept = ui.garage_events_list.item(18)
+
+    ui.garage_controller.events.append('[t21] event')
+    ui.update_garage_status()
+
+    # The existing rows are kept; only the new one is inserted and the oldest dropped
+    assert ui.garage_events_list.count() == 20
+    assert ui.garage_events_list.item(0).text() == '[t21] event'
+    assert ui.garage_events_list.item(19) is oldest_kept
+    assert oldest_kept.text() == '[t2] event'
+
+
+def test_hhmm_round_trip():
+    assert gw._hhmm_to_minutes('04:30') == 270
+    assert gw._minutes_to_hhmm(gw._hhmm_to_minutes('23:05')) == '23:05'
+    for bad in ('24:00', '7', 'aa:bb'):
+        with pytest.raises(ValueError):
+            gw._hhmm_to_minutes(bad)
+
+
+def test_blackout_minutes_follow_editors_and_lookup(qtbot):
+    from datetime import datetime as dt
+    from PyQt5.QtCore import QTime
+
+    ui = GateWiseUI()
+    qtbot.addWidget(ui)
+
+    ui.add_time_block('Monday', '04:00', '05:00')
+    ui.add_time_block('Sunday', '23:00', '01:30')
+    start, end, _ = ui.blackout_blocks['Monday'][0]
+    end.setTime(QTime(6, 15))
+
+    assert ui._blackout_minutes['Monday'] == [[240, 375]]
+    # 2024-01-01 was a Monday
+    assert ui.is_blackout(dt(2024, 1, 1, 6, 0))
+    assert not ui.is_blackout(dt(2024, 1, 1, 6, 15))
+    # Sunday's block wraps past midnight into Monday
+    assert ui.is_blackout(dt(2024, 1, 1, 1, 0))
+    assert ui.is_blackout(dt(2023, 12, 31, 23, 30))
+    assert not ui.is_blackout(dt(2024, 1, 2, 4, 30))
+
+    ui.save_blackout_schedule()
+    with open('blackout.json') as f:
+        assert json.load(f)['Monday'] == [{'start': '04:00', 'end': '06:15'}]
+
+
+def test_user_dialog_scan_fills_uid_via_signal(qtbot):
+    dlg = gw.UserDialog()
+    qtbot.addWidget(dlg)
+
+    # conftest installs a fake reader that always reads 12345678
+    dlg.scan_uid()
+    qtbot.waitUntil(lambda: dlg.uid_input.text() == '12345678', timeout=2000)
+
+    # Once closed, the dialog stops listening to the shared reader
+    dlg.reject()
+    dlg.uid_input.clear()
+    with qtbot.waitSignal(gw.get_rfid_worker().uid_scanned, timeout=2000):
+        gw.get_rfid_worker().scan_requested.emit()
+    qtbot.wait(50)
+    assert dlg.uid_input.text() == ''
+
+
+def test_screens_are_built_on_first_visit(qtbot):
+    ui = GateWiseUI()
+    qtbot.addWidget(ui)
+    assert ui.stack.count() == 1
+    assert ui.user_screen is None
+
+    ui.show_user_management()
+    screen = ui.user_screen
+    assert ui.stack.currentWidget() is screen
+    assert ui.stack.count() == 2
+
+    ui.show_main()
+    ui.show_user_management()
+    assert ui.user_screen is screen
+    assert ui.stack.count() == 2
+
+
+def test_users_load_in_background(qtbot):
+    with open('users.json', 'w') as f:
+        json.dump([{'uid': '1', 'name': 'Alice', 'isAdmin': False}], f)
+
+    ui = GateWiseUI()
+    qtbot.addWidget(ui)
+    ui.show_user_management()
+    assert not ui.add_user_btn.isEnabled()
+
+    qtbot.waitUntil(lambda: ui.user_model.rowCount() == 1, timeout=2000)
+    assert ui.add_user_btn.isEnabled()
+    assert ui.users == [{'uid': '1', 'name': 'Alice', 'isAdmin': False}]
+
+
+def test_user_screen_filled_when_sync_read_beats_loader(qtbot):
+    with open('users.json', 'w') as f:
+        json.dump([{'uid': '1', 'name': 'Alice', 'isAdmin': False}], f)
+
+    ui = GateWiseUI()
+    qtbot.addWidget(ui)
+    ui.show_user_management()
+    assert not ui.add_user_btn.isEnabled()
+
+    # A synchronous read (e.g. Push to Doors) fills the list before the loader reports
+    assert ui.users == [{'uid': '1', 'name': 'Alice', 'isAdmin': False}]
+    qtbot.waitUntil(lambda: ui._users_loader is None, timeout=2000)
+    assert ui.add_user_btn.isEnabled()
+    assert ui.user_model.rowCount() == 1
+
+
+def test_users_available_before_user_screen_is_built(qtbot):
+    with open('users.json', 'w') as f:
+        json.dump([{'uid': '1', 'name': 'Alice', 'isAdmin': False}], f)
+
+    ui = GateWiseUI()
+    qtbot.addWidget(ui)
+    assert ui._users is None
+
+    assert ui._user_for_uid('1')['name'] == 'Alice'
+    ui.users.append({'uid': '2', 'name': 'Bob', 'isAdmin': False})
+    ui.refresh_user_list()
+    assert ui.user_screen is None
+
+    # The screen shows the in-memory list, not a fresh read of the file
+    ui.show_user_management()
+    assert ui.user_model.rowCount() == 2
+
+
+def test_compact_json_save(qtbot, monkeypatch):
+    ui = GateWiseUI()
+    qtbot.addWidget(ui)
+    monkeypatch.setattr(ui.config, 'pretty_json', False)
+
+    ui.users = [{'uid': '1001', 'name': 'Alice', 'isAdmin': False}]
+    ui.save_users()
+
+    with open('users.json', 'rb') as f:
+        raw = f.read()
+    assert b'\n' not in raw and b': ' not in raw
+    assert json.loads(raw) == ui.users
+
+
+def test_encoded_users_shared_until_next_save(qtbot, monkeypatch):
+    ui = GateWiseUI()
+    qtbot.addWidget(ui)
+    monkeypatch.setattr(ui.config, 'pretty_json', False)
+
+    ui.users = [{'uid': '1001', 'name': 'Alice', 'isAdmin': False}]
+    ui.save_users()
+    encoded = ui._encoded_users()
+    with open('users.json', 'rb') as f:
+        assert f.read() == encoded
+    # The push reuses the bytes written by the save
+    assert ui._encoded_users() is encoded
+
+    # Saving unchanged users again keeps the encoding a push already made
+    ui.save_users()
+    assert ui._encoded_users() is encoded
+
+    # Edits go through _mark_users_dirty, which drops the stale bytes
+    ui.users.append({'uid': '1002', 'name': 'Bob', 'isAdmin': True})
+    ui._mark_users_dirty()
+    ui._flush_users_save()
+    assert json.loads(ui._encoded_users()) == ui.users
+    with open('users.json', 'rb') as f:
+        assert json.loads(f.read()) == ui.users
+
+
+def test_push_after_reassigning_users_sends_new_list(qtbot, monkeypatch):
+    ui = GateWiseUI()
+    qtbot.addWidget(ui)
+    monkeypatch.setattr(ui.config, 'pretty_json', False)
+    ui.users = [{'uid': '1001', 'name': 'Alice', 'isAdmin': False}]
+    ui.save_users()
+    ui._encoded_users()
+
+    # Replaced without a save: the next push (which sends _encoded_users) must not reuse old bytes
+    ui.users = [{'uid': '2002', 'name': 'Carol', 'isAdmin': True}]
+    assert json.loads(ui._encoded_users()) == ui.users
+
+
+def test_write_json_file_replaces_atomically(tmp_path):
+    path = str(tmp_path / 'blackout.json')
+    with open(path, 'w') as f:
+        f.write('{"Monday": []}')
+
+    gw._write_json_file(path, {'Monday': [{'start': '04:00', 'end': '05:00'}]})
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == ['blackout.json']
+    with open(path) as f:
+        text = f.read()
+    assert text.startswith('{\n  "Monday"')
+    assert gw._cached_json_load(path) == {'Monday': [{'start': '04:00', 'end': '05:00'}]}
+
+
+def test_widgets_styled_only_by_app_stylesheet(qtbot):
+    ui = GateWiseUI()
+    qtbot.addWidget(ui)
+    for show in (ui.show_settings, ui.show_logs, ui.show_blackout, ui.show_user_management):
+        show()
+    styled = [w for w in ui.findChildren(QWidget) if w.styleSheet()]
+    assert styled == []
+
+
+def test_icons_shared_between_windows(qtbot):
+    first = GateWiseUI()
+    qtbot.addWidget(first)
+    second = GateWiseUI()
+    qtbot.addWidget(second)
+
+    assert not first._icons['logs'].isNull()
+    assert second._icons['logs'] is first._icons['logs']
+    assert gw._cached_icon('missing.png').isNull()
+    # The decoded pixmap is shared through QPixmapCache
+    cached = gw._cached_pixmap(first.logs_icon_path)
+    assert cached.cacheKey() == gw._cached_pixmap(first.logs_icon_path).cacheKey()
+
+
+def test_removed_time_block_is_deleted(qtbot):
+    from PyQt5 import sip
+    from PyQt5.QtCore import QCoreApplication, QEvent
+    from PyQt5.QtWidgets import QPushButton
+
+    ui = GateWiseUI()
+    qtbot.addWidget(ui)
+    ui.add_time_block('Monday', '04:00', '05:00')
+    _, _, container = ui.blackout_blocks['Monday'][0]
+
+    container.findChild(QPushButton).click()
+    QCoreApplication.sendPostedEvents(None, QEvent.DeferredDelete)
+
+    assert ui.blackout_blocks['Monday'] == []
+    assert sip.isdeleted(container)
+
+
+def test_user_crud_keeps_uid_index(qtbot, monkeypatch):
+    from PyQt5.QtWidgets import QMessageBox
+
+    pending = []
+
+    class FakeUserDialog:
+        def __init__(self, parent=None, user=None):
+            pass
+
+        def exec_(self):
+            return True
+
+        def get_user(self):
+            return pending.pop(0)
+
+    warnings = []
+    monkeypatch.setattr(gw, 'UserDialog', FakeUserDialog)
+    monkeypatch.setattr(QMessageBox, 'information', lambda *a: None)
+    monkeypatch.setattr(QMessageBox, 'warning', lambda *a: warnings.append(a[1]))
+    monkeypatch.setattr(QMessageBox, 'question', lambda *a: QMessageBox.Yes)
+    ui = GateWiseUI()
+    qtbot.addWidget(ui)
+    ui.show_user_management()
+    ui.users = [{'uid': '1', 'name': 'Alice', 'isAdmin': False}]
+
+    pending.append({'uid': '2', 'name': 'Bob', 'isAdmin': False})
+    ui.add_user_dialog()
+    pending.append({'uid': '2', 'name': 'Bobby', 'isAdmin': False})
+    ui.add_user_dialog()
+    assert warnings == ['Duplicate UID']
+
+    pending.append({'uid': '1', 'name': 'Alicia', 'isAdmin': True})
+    ui.edit_user_dialog(ui._user_for_uid('1'))
+    assert ui.users[0] == {'uid': '1', 'name': 'Alicia', 'isAdmin': True}
+
+    ui.delete_user(ui._user_for_uid('1'))
+    assert ui.users == [{'uid': '2', 'name': 'Bob', 'isAdmin': False}]
+    assert ui._user_for_uid('1') is None
+    assert ui._user_for_uid('2') is ui.users[0]
+
+
+def test_user_edits_are_saved_once_after_burst(qtbot, monkeypatch):
+    import os
+
+    saves = []
+    original_save = GateWiseUI.save_users
+    monkeypatch.setattr(GateWiseUI, 'save_users', lambda self: (saves.append(True), original_save(self)))
+    ui = GateWiseUI()
+    qtbot.addWidget(ui)
+    ui.users = []
+
+    for i in range(3):
+        ui.users.append({'uid': str(i), 'name': 'User', 'isAdmin': False})
+        ui._mark_users_dirty()
+    assert saves == [] and not os.path.exists('users.json')
+
+    qtbot.waitUntil(lambda: len(saves) > 0, timeout=2000)
+    qtbot.wait(100)
+    assert saves == [True]
+    with open('users.json') as f:
+        assert len(json.load(f)) == 3
+
+    # Closing the window flushes an edit the timer hasn't saved yet
+    ui.users.pop()
+    ui._mark_users_dirty()
+    ui.close()
+    with open('users.json') as f:
+        assert len(json.load(f)) == 2
@@ -1,19 +1,36 @@
 import sys
 import os
+import asyncio
+import time
+import copy
 import json
-import threading
 from datetime import datetime
 import socket
+import struct
+import zlib
+import bisect
+import threading
+from collections import deque
 from PyQt5.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-    QPushButton, QListWidget, QSizePolicy, QStackedWidget, QLineEdit, QDialog,
+    QPushButton, QListWidget, QListView, QSizePolicy, QStackedWidget, QLineEdit, QDialog,
     QDialogButtonBox, QGridLayout, QComboBox, QScrollArea, QGroupBox, QTimeEdit,
-    QMessageBox, QCheckBox
+    QMessageBox, QCheckBox, QStyledItemDelegate, QStyle
+)
+from PyQt5.QtGui import QPixmap, QPixmapCache, QFont, QIcon, QPalette, QColor
+from PyQt5.QtCore import (
+    Qt, QTimer, QDateTime, QSize, QTime, QObject, QThread, pyqtSignal, pyqtSlot,
+    QAbstractListModel, QModelIndex, QRect, QEvent, QRunnable, QThreadPool
 )
-from PyQt5.QtGui import QPixmap, QFont, QIcon, QPalette, QColor
-from PyQt5.QtCore import Qt, QTimer, QDateTime, QSize, QTime
+from PyQt5 import sip
 from core.config import get_config
 
+# orjson is optional; it encodes several times faster than the stdlib json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Load configuration
 config = get_config()
 
@@ -29,25 +46,516 @@ if config.rfid_enabled:
     except Exception as e:
         print(f"[WARNING] Failed to initialize RFID reader: {e}")
 
+RFID_AVAILABLE = reader is not None
+
 DOOR_MODULE_IPS = config.door_module_ips
 DOOR_MODULE_PORT = config.door_module_port
 
-# Try to import RFID reader - will fail on systems without hardware
-try:
-    from mfrc522 import SimpleMFRC522
-    reader = SimpleMFRC522()
-    RFID_AVAILABLE = True
-except (ImportError, RuntimeError):
-    reader = None
-    RFID_AVAILABLE = False
-    print("[WARNING] MFRC522 not available. RFID scanning will be disabled.")
-
 # Import garage controller
 from core.garage import get_garage_controller
 
 DOOR_MODULE_IPS = ["192.168.0.51"]  # replace with actual IPs
 DOOR_MODULE_PORT = 5006
 
+# Application-wide stylesheet. Widgets opt into a look with setProperty("role", ...)
+# (or "kind" for group boxes) so Qt parses one sheet instead of one per widget.
+APP_QSS = """
+QLabel[role="title"] { padding: 20px; }
+QLabel[role="banner"] { background-color: #27ae60; color: white; font-size: 14px; padding: 6px; border-radius: 6px; }
+QLabel[state="open"] { color: #e74c3c; }
+QLabel[state="closed"] { color: #27ae60; }
+QLabel[state="opening"], QLabel[state="closing"] { color: #f39c12; }
+QLabel[state="unknown"] { color: #95a5a6; }
+QPushButton[role="icon"] { background-color: transparent; color: white; }
+QPushButton[role="action"] { background-color: #34495e; color: white; padding: 10px; border-radius: 10px; font-size: 14px; }
+QPushButton[role="menu"] { background-color: #34495e; color: white; font-size: 16px; padding: 12px; }
+QPushButton[role="back"] { background-color: #7f8c8d; color: white; font-size: 14px; padding: 10px; }
+QPushButton[role="secondary"] { background-color: #2c3e50; color: white; font-size: 16px; padding: 8px; }
+QPushButton[role="primary"] { background-color: #2980b9; color: white; font-size: 16px; padding: 10px; }
+QPushButton[role="success"] { background-color: #27ae60; color: white; font-size: 16px; padding: 10px; }
+QPushButton[role="danger"] { background-color: #c0392b; color: white; font-size: 14px; padding: 10px; }
+QPushButton[role="garage"] { background-color: #e67e22; color: white; font-size: 18px; padding: 15px; font-weight: bold; }
+QPushButton[role="remove"] { font-size: 18px; color: red; background: transparent; }
+QComboBox[role="field"] { background-color: #1e1e1e; color: white; font-size: 14px; padding: 8px; }
+QListWidget[role="events"] { background-color: #1e1e1e; color: white; font-size: 12px; }
+QCheckBox[role="toggle"] { font-size: 14px; }
+QCheckBox[role="switch"] { color: white; font-size: 14px; }
+QCheckBox[role="switch"]::indicator { width: 44px; height: 24px; border-radius: 12px; }
+QCheckBox[role="switch"]::indicator:unchecked { background: #7f8c8d; }
+QCheckBox[role="switch"]::indicator:checked { background: #27ae60; }
+QTimeEdit { font-size: 16px; }
+QGroupBox[kind="day"] { font-weight: bold; border: 1px solid #444; margin-top: 10px; padding: 10px; }
+QGroupBox[kind="panel"] { font-weight: bold; border: 2px solid #444; margin-top: 10px; padding: 15px; }
+QGroupBox[kind="events"] { font-weight: bold; border: 2px solid #444; margin-top: 10px; padding: 10px; }
+"""
+
+
+def _app_stylesheet(primary_color):
+    return "QWidget { background-color: %s; color: white; }\n" % primary_color + APP_QSS
+
+
+ICON_DIR = os.path.join(os.path.dirname(__file__), "..", "resources", "icons")
+
+# Decoded icons and logos together are well under 1 MB
+PIXMAP_CACHE_LIMIT_KB = 2048
+
+# Icons keyed by path; QIcon objects are shared, so every window reuses one load
+_ICON_CACHE = {}
+
+
+def _cached_pixmap(path):
+    """Decoded QPixmap for `path` from QPixmapCache, loading it on a miss (null if missing)."""
+    pixmap = QPixmapCache.find(path)
+    if pixmap is None:
+        pixmap = QPixmap(path)
+        if not pixmap.isNull():
+            QPixmapCache.insert(path, pixmap)
+    return pixmap
+
+
+def _cached_icon(path):
+    """QIcon for `path`, or an empty QIcon if the file is missing; loaded once per path."""
+    icon = _ICON_CACHE.get(path)
+    if icon is None:
+        # A missing file just decodes to a null pixmap, no separate existence check needed
+        pixmap = _cached_pixmap(path)
+        icon = QIcon(pixmap) if not pixmap.isNull() else QIcon()
+        _ICON_CACHE[path] = icon
+    return icon
+
+
+# Parsed JSON files keyed by absolute path -> ((mtime_ns, size), data)
+_JSON_CACHE = {}
+
+
+def _json_stamp(path):
+    st = os.stat(path)
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _cached_json_load(path):
+    """Load JSON from `path`, skipping the parse while the file is unchanged.
+
+    Callers get a deep copy so mutating the result never touches the cache.
+    """
+    key = os.path.abspath(path)
+    stamp = _json_stamp(path)
+    entry = _JSON_CACHE.get(key)
+    if entry is None or entry[0] != stamp:
+        with open(path, "rb") as f:
+            data = _json_loads_bytes(f.read())
+        entry = (stamp, data)
+        _JSON_CACHE[key] = entry
+    return copy.deepcopy(entry[1])
+
+
+def _cache_json_written(path, data):
+    """Refresh the cache entry for `path` after we have written `data` to it."""
+    _JSON_CACHE[os.path.abspath(path)] = (_json_stamp(path), copy.deepcopy(data))
+
+
+def _json_loads_bytes(raw):
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _json_dumps_bytes(obj):
+    """Compact UTF-8 JSON for the wire and for non-human-edited files."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def _json_dumps_pretty(obj):
+    """Two-space indented UTF-8 JSON for files people edit by hand."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
+def _write_json_file(path, data, pretty=True, encoded=None):
+    """Atomically write `data` to `path` as JSON and refresh the read cache.
+
+    The file is written beside `path` and renamed over it, so a crash or
+    power cut leaves either the old file or the new one, never half of it.
+    Pretty output is indented for hand editing. Compact output skips the
+    whitespace and is fsynced, which suits embedded deployments; pass
+    `encoded` if the caller already has `_json_dumps_bytes(data)` to hand.
+    """
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        if pretty:
+            f.write(_json_dumps_pretty(data))
+        else:
+            f.write(encoded if encoded is not None else _json_dumps_bytes(data))
+            f.flush()
+            os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+    _cache_json_written(path, data)
+
+
+def _minutes_to_hhmm(minutes):
+    """Format minutes-since-midnight as the "HH:mm" strings stored in blackout.json."""
+    return "%02d:%02d" % divmod(minutes, 60)
+
+
+def _hhmm_to_minutes(text):
+    """Parse an "HH:mm" string from blackout.json into minutes since midnight."""
+    hours, minutes = text.split(":")
+    hours, minutes = int(hours), int(minutes)
+    if not (0 <= hours < 24 and 0 <= minutes < 60):
+        raise ValueError(f"invalid time {text!r}")
+    return hours * 60 + minutes
+
+
+def _build_blackout_lookup(schedule):
+    """Turn {day: [[start_min, end_min], ...]} into {day: (starts, ends)} for bisect lookups.
+
+    Overlapping blocks are merged so each day is a sorted list of disjoint
+    intervals. A block whose end is before its start runs past midnight and
+    continues on the following day.
+    """
+    days = list(schedule)
+    spans = {day: [] for day in days}
+    for i, day in enumerate(days):
+        for start, end in schedule[day]:
+            if end >= start:
+                spans[day].append((start, end))
+            else:
+                spans[day].append((start, 24 * 60))
+                spans[days[(i + 1) % len(days)]].append((0, end))
+
+    lookup = {}
+    for day, intervals in spans.items():
+        starts, ends = [], []
+        for start, end in sorted(intervals):
+            if ends and start <= ends[-1]:
+                ends[-1] = max(ends[-1], end)
+            else:
+                starts.append(start)
+                ends.append(end)
+        lookup[day] = (starts, ends)
+    return lookup
+
+
+# Door push wire format: each push is one frame on a long-lived TCP stream,
+#
+#     tag (1 byte) | length (4 bytes, big-endian) | body (length bytes)
+#
+# tag 0 means the body is the raw UTF-8 JSON, tag 1 means it is zlib-compressed
+# JSON. Small user lists go raw since compressing them saves almost nothing.
+# The door module answers every frame with one byte: 0 if it applied the
+# users, anything else if it rejected them.
+FRAME_RAW = 0
+FRAME_ZLIB = 1
+FRAME_ACK_OK = b"\x00"
+FRAME_COMPRESS_THRESHOLD = 512
+
+
+def _frame_payload(data):
+    """Tag and length-prefix an encoded payload so several pushes can share one stream."""
+    if len(data) > FRAME_COMPRESS_THRESHOLD:
+        # Level 1: most of the size win for a fraction of the CPU on the Pi
+        data = zlib.compress(data, 1)
+        return struct.pack("!BI", FRAME_ZLIB, len(data)) + data
+    return struct.pack("!BI", FRAME_RAW, len(data)) + data
+
+
+DOOR_PUSH_ATTEMPTS = 3
+DOOR_PUSH_BACKOFF_S = 0.2
+DOOR_ACK_TIMEOUT_S = 2.0
+# Bound on connecting and on handing a frame to a door module that stops
+# reading; TCP_USER_TIMEOUT covers the same case on Linux only
+DOOR_SEND_TIMEOUT_S = 5.0
+# Drop a connection whose sent data stays unacknowledged this long (ms), so a
+# half-open door module fails the next push instead of silently eating it
+DOOR_USER_TIMEOUT_MS = 2000
+
+
+async def _open_door_stream(conns, host, port):
+    """Return the cached (reader, writer) for `host`, (re)connecting if needed."""
+    stream = conns.get(host)
+    if stream is not None and (stream[0].at_eof() or stream[1].is_closing()):
+        _drop_door_stream(conns, host)
+        stream = None
+    if stream is None:
+        stream = await asyncio.wait_for(asyncio.open_connection(host, port), timeout=DOOR_SEND_TIMEOUT_S)
+        # asyncio already turns on TCP_NODELAY for TCP streams
+        sock = stream[1].get_extra_info("socket")
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        if hasattr(socket, "TCP_USER_TIMEOUT"):  # Linux only
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_USER_TIMEOUT, DOOR_USER_TIMEOUT_MS)
+        conns[host] = stream
+    return stream
+
+
+def _drop_door_stream(conns, host):
+    stream = conns.pop(host, None)
+    if stream is not None:
+        stream[1].close()
+
+
+async def _send_to_host(host, port, frame, conns):
+    """Send a framed payload to a single door module. Returns True on success.
+
+    The connection in `conns` is reused across pushes; if it turns out to be
+    broken it is dropped and a fresh one is tried, up to DOOR_PUSH_ATTEMPTS
+    times with exponential backoff.
+    """
+    error = None
+    for attempt in range(DOOR_PUSH_ATTEMPTS):
+        if attempt:
+            await asyncio.sleep(DOOR_PUSH_BACKOFF_S * 2 ** (attempt - 1))
+        try:
+            reader, writer = await _open_door_stream(conns, host, port)
+            # Make room for the whole frame so it goes out in one kernel write
+            sock = writer.get_extra_info("socket")
+            if sock.getsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF) < len(frame):
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, len(frame))
+            writer.write(frame)
+            await asyncio.wait_for(writer.drain(), timeout=DOOR_SEND_TIMEOUT_S)
+            ack = await asyncio.wait_for(reader.read(1), timeout=DOOR_ACK_TIMEOUT_S)
+            if not ack:
+                raise ConnectionError("connection closed before acknowledging")
+            if ack != FRAME_ACK_OK:
+                print(f"[WARN] Door module {host}:{port} rejected the push (code {ack[0]})")
+                return False
+            print(f"[INFO] Pushed users to {host}:{port}")
+            return True
+        except (OSError, asyncio.TimeoutError) as e:
+            _drop_door_stream(conns, host)
+            error = str(e) or "timed out"
+        except asyncio.CancelledError:
+            # Stopped mid-frame; the stream is in an unknown state
+            _drop_door_stream(conns, host)
+            raise
+    print(f"[WARN] Failed to push to {host}:{port} - {error}")
+    return False
+
+
+class DoorPushWorker(QObject):
+    """Pushes encoded payloads to every door module from one long-lived QThread.
+
+    Call `submit(frame)` from the GUI thread. Pushes run one at a time, and a
+    frame still waiting behind a push in flight is replaced by newer ones,
+    since only the latest user list matters. Each push runs the worker's own
+    asyncio loop on the worker thread and contacts all hosts concurrently, so
+    it takes as long as the slowest door module rather than the sum of all of
+    them, without a thread per host. Connections are kept open between
+    pushes. `finished` carries a {host: ok} mapping back to the GUI thread.
+    Call `stop()` from any thread to cancel the push in flight and drop
+    waiting frames, then `close()` once the thread has stopped; a stopped
+    push emits nothing.
+    """
+    push_requested = pyqtSignal()
+    finished = pyqtSignal(dict)
+
+    def __init__(self, hosts, port):
+        super().__init__()
+        self.hosts = list(hosts)
+        self.port = port
+        # {host: (StreamReader, StreamWriter)}, only touched from inside the loop
+        self.conns = {}
+        self._loop = asyncio.new_event_loop()
+        self._waiting = None
+        # Push in flight, if any; guarded by _lock together with _stopping
+        self._task = None
+        self._stopping = False
+        self._lock = threading.Lock()
+        self.push_requested.connect(self._drain)
+
+    def submit(self, frame):
+        """Queue `frame`, replacing any frame that has not been sent yet."""
+        with self._lock:
+            if self._stopping:
+                return
+            idle = self._waiting is None
+            self._waiting = frame
+        if idle:
+            self.push_requested.emit()
+
+    @pyqtSlot()
+    def _drain(self):
+        with self._lock:
+            frame, self._waiting = self._waiting, None
+        if frame is None:
+            return
+        results = self.push(frame)
+        if results is not None:
+            self.finished.emit(results)
+
+    def push(self, frame):
+        """Send `frame` to every host and return {host: ok}, or None if stopped."""
+        with self._lock:
+            if self._stopping:
+                return None
+            self._task = self._loop.create_task(self._push_all(frame))
+        try:
+            return self._loop.run_until_complete(self._task)
+        except asyncio.CancelledError:
+            return None
+        finally:
+            with self._lock:
+                self._task = None
+
+    def stop(self):
+        """Cancel the push in flight and refuse new ones. Safe to call from any thread."""
+        with self._lock:
+            self._stopping = True
+            self._waiting = None
+            if self._task is not None:
+                # The task belongs to the worker thread's loop; cancel it there
+                self._loop.call_soon_threadsafe(self._task.cancel)
+
+    async def _push_all(self, frame):
+        # The loop sits idle between pushes; one pass lets it notice door
+        # modules that closed their end meanwhile, before streams are reused
+        await asyncio.sleep(0)
+        oks = await asyncio.gather(*(_send_to_host(host, self.port, frame, self.conns) for host in self.hosts))
+        return dict(zip(self.hosts, oks))
+
+    def close(self):
+        """Close every door connection and the event loop."""
+        if self._loop.is_closed():
+            return
+        writers = [writer for _, writer in self.conns.values()]
+        self.conns.clear()
+        for writer in writers:
+            writer.close()
+        if writers:
+            self._loop.run_until_complete(self._wait_closed(writers))
+        self._loop.close()
+
+    @staticmethod
+    async def _wait_closed(writers):
+        await asyncio.gather(*(w.wait_closed() for w in writers), return_exceptions=True)
+
+
+# Gap between reader polls while waiting for a card
+RFID_POLL_INTERVAL_S = 0.05
+
+
+# (thread, worker) pairs that didn't stop in time; kept referenced so Qt never
+# destroys a QThread, or the worker on it, while it is still running
+_abandoned_threads = []
+
+
+def _join_thread(thread, worker, timeout_ms):
+    """Wait up to `timeout_ms` for `thread` to finish and return whether it did.
+
+    A worker stuck in a call that can't be interrupted is left running rather
+    than terminated: killing a thread that runs Python code can leave the
+    interpreter unable to exit.
+    """
+    if thread.wait(timeout_ms):
+        return True
+    print("[WARN] Worker thread did not stop in time; leaving it running")
+    _abandoned_threads.append((thread, worker))
+    return False
+
+
+class RfidWorker(QObject):
+    """Performs every MFRC522 read on one long-lived QThread.
+
+    Emit `scan_requested` to start a read; the result arrives on
+    `uid_scanned` or `scan_failed`. Requests are serialised by the thread's
+    event queue, so the SPI reader never sees overlapping reads. A read
+    waiting for a card polls the reader and gives up once `stop()` is called.
+    """
+    scan_requested = pyqtSignal()
+    uid_scanned = pyqtSignal(str)
+    scan_failed = pyqtSignal(str)
+
+    def __init__(self, reader):
+        super().__init__()
+        self.reader = reader
+        self._stop = threading.Event()
+        self.scan_requested.connect(self._scan)
+
+    def stop(self):
+        """Abandon a read waiting for a card. Safe to call from any thread."""
+        self._stop.set()
+
+    @pyqtSlot()
+    def _scan(self):
+        try:
+            read_no_block = getattr(self.reader, "read_no_block", None)
+            if read_no_block is None:
+                # Readers without a non-blocking read can't be interrupted; shutdown
+                # gives up waiting for them (see _join_thread)
+                uid, _ = self.reader.read()
+            else:
+                uid, _ = read_no_block()
+                while not uid:
+                    if self._stop.wait(RFID_POLL_INTERVAL_S):
+                        return
+                    uid, _ = read_no_block()
+            self.uid_scanned.emit(str(uid))
+        except Exception as e:
+            self.scan_failed.emit(str(e))
+
+
+_rfid_thread = None
+_rfid_worker = None
+
+
+def get_rfid_worker():
+    """Return the shared RfidWorker, starting its thread on first use (None without a reader)."""
+    global _rfid_thread, _rfid_worker
+    if reader is None:
+        return None
+    # Recreate if Qt tore the old one down along with a previous QApplication
+    if _rfid_worker is None or sip.isdeleted(_rfid_worker):
+        _stop_rfid_worker()
+        _rfid_thread = QThread()
+        _rfid_worker = RfidWorker(reader)
+        _rfid_worker.moveToThread(_rfid_thread)
+        _rfid_thread.start()
+        app = QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(_stop_rfid_worker)
+    return _rfid_worker
+
+
+def _stop_rfid_worker():
+    global _rfid_thread, _rfid_worker
+    if _rfid_thread is not None and not sip.isdeleted(_rfid_thread):
+        if _rfid_worker is not None and not sip.isdeleted(_rfid_worker):
+            _rfid_worker.stop()
+        _rfid_thread.quit()
+        _join_thread(_rfid_thread, _rfid_worker, 1000)
+    # A stopped worker can't take scans any more; the next get_rfid_worker starts afresh
+    _rfid_thread = _rfid_worker = None
+
+
+class _JsonLoaderSignals(QObject):
+    loaded = pyqtSignal(object)
+
+
+class JsonLoader(QRunnable):
+    """Reads a JSON file on QThreadPool and emits `signals.loaded` with the result.
+
+    A missing file loads as `default`. The path is resolved when the loader is
+    created, so a later change of working directory doesn't affect it.
+    """
+
+    def __init__(self, path, default=None):
+        super().__init__()
+        self.path = os.path.abspath(path)
+        self.default = default
+        self.signals = _JsonLoaderSignals()
+
+    def run(self):
+        try:
+            data = _cached_json_load(self.path)
+        except FileNotFoundError:
+            data = self.default
+        except (OSError, ValueError) as e:
+            print(f"[ERROR] Failed to load {self.path}: {e}")
+            data = self.default
+        self.signals.loaded.emit(data)
+
 
 class Toggle(QCheckBox):
     """Simple Toggle control implemented as a styled QCheckBox.
@@ -56,13 +564,8 @@ class Toggle(QCheckBox):
     """
     def __init__(self, label="", parent=None):
         super().__init__(label, parent)
-        # Basic visual styling; keep small and self-contained so tests/dev UI render.
-        self.setStyleSheet(
-            "QCheckBox { color: white; font-size: 14px; }"
-            "QCheckBox::indicator { width: 44px; height: 24px; border-radius: 12px; }"
-            "QCheckBox::indicator:unchecked { background: #7f8c8d; }"
-            "QCheckBox::indicator:checked { background: #27ae60; }"
-        )
+        # Styled by the QCheckBox[role="switch"] rules in APP_QSS
+        self.setProperty("role", "switch")
 
 
 class PasswordDialog(QDialog):
@@ -85,6 +588,10 @@ class PasswordDialog(QDialog):
         return self.password_input.text()
 
 class UserDialog(QDialog):
+    # Relayed from the RfidWorker thread; Qt queues them onto the dialog's thread
+    uid_read = pyqtSignal(str)
+    scan_error = pyqtSignal(str)
+
     def __init__(self, parent=None, user=None):
         super().__init__(parent)
         self.setWindowTitle("User Details")
@@ -108,6 +615,10 @@ class UserDialog(QDialog):
 
         self.setLayout(layout)
 
+        self.uid_read.connect(self.uid_input.setText)
+        self.scan_error.connect(self._show_scan_error)
+        self._scan_connected = False
+
         if user:
             self.uid_input.setText(user['uid'])
             self.name_input.setText(user['name'])
@@ -115,23 +626,28 @@ class UserDialog(QDialog):
             self.uid_input.setDisabled(True)
 
     def scan_uid(self):
-        if not RFID_AVAILABLE or reader is None:
+        worker = get_rfid_worker()
+        if worker is None:
             QMessageBox.warning(self, "RFID Not Available", "RFID scanning is not available on this system.")
             return
+        # Listen to the shared reader only while this dialog is open (see done)
+        if not self._scan_connected:
+            worker.uid_scanned.connect(self.uid_read)
+            worker.scan_failed.connect(self.scan_error)
+            self._scan_connected = True
         self.uid_input.setPlaceholderText("Waiting for scan...")
-        thread = threading.Thread(target=self._read_uid, daemon=True)
-        thread.start()
+        worker.scan_requested.emit()
 
-    def _read_uid(self):
-        if reader is None:
-            QMessageBox.warning(self, "RFID Error", "RFID reader not available")
-        if not RFID_AVAILABLE or reader is None:
-            return
-        try:
-            uid, _ = reader.read()
-            self.uid_input.setText(str(uid))
-        except Exception as e:
-            QMessageBox.warning(self, "Scan Error", f"Failed to read RFID card: {e}")
+    def done(self, result):
+        if self._scan_connected:
+            worker = get_rfid_worker()
+            worker.uid_scanned.disconnect(self.uid_read)
+            worker.scan_failed.disconnect(self.scan_error)
+            self._scan_connected = False
+        super().done(result)
+
+    def _show_scan_error(self, message):
+        QMessageBox.warning(self, "Scan Error", f"Failed to read RFID card: {message}")
 
     def get_user(self):
         return {
@@ -140,32 +656,219 @@ class UserDialog(QDialog):
             "isAdmin": self.admin_check.isChecked()
         }
 
+
+class UserListModel(QAbstractListModel):
+    """The user list as a flat model; Qt.UserRole holds the user dict for a row."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._users = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._users)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        user = self._users[index.row()]
+        if role == Qt.DisplayRole:
+            return f"UID: {user['uid']}  Name: {user['name']}  Admin: {'Yes' if user['isAdmin'] else 'No'}"
+        if role == Qt.UserRole:
+            return user
+        return None
+
+    def set_users(self, users):
+        """Bring the rows in line with `users`, signalling only the rows that changed.
+
+        Surviving rows keep their position and new users are appended, so an
+        edit repaints one row instead of resetting the view.
+        """
+        wanted = {u['uid'] for u in users}
+        if self._users and not any(u['uid'] in wanted for u in self._users):
+            # Nothing survives (e.g. a reload from disk): a reset is cheaper than row-by-row removal
+            self.beginResetModel()
+            self._users = [dict(u) for u in users]
+            self.endResetModel()
+            return
+
+        for row in reversed(range(len(self._users))):
+            if self._users[row]['uid'] not in wanted:
+                self.beginRemoveRows(QModelIndex(), row, row)
+                del self._users[row]
+                self.endRemoveRows()
+
+        rows = {u['uid']: row for row, u in enumerate(self._users)}
+        added = []
+        for user in users:
+            row = rows.get(user['uid'])
+            if row is None:
+                added.append(dict(user))
+            elif self._users[row] != user:
+                self._users[row] = dict(user)
+                index = self.index(row)
+                self.dataChanged.emit(index, index)
+        if added:
+            first = len(self._users)
+            self.beginInsertRows(QModelIndex(), first, first + len(added) - 1)
+            self._users.extend(added)
+            self.endInsertRows()
+
+
+# RFID log entries kept in memory; older entries fall off the front
+LOG_BUFFER_SIZE = 1000
+
+
+class LogModel(QAbstractListModel):
+    """RFID log lines in a fixed-size ring buffer, oldest first."""
+
+    def __init__(self, maxlen=LOG_BUFFER_SIZE, parent=None):
+        super().__init__(parent)
+        self._buf = deque(maxlen=maxlen)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._buf)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if index.isValid() and role == Qt.DisplayRole:
+            return self._buf[index.row()]
+        return None
+
+    def append(self, entry):
+        if len(self._buf) == self._buf.maxlen:
+            self.beginRemoveRows(QModelIndex(), 0, 0)
+            self._buf.popleft()
+            self.endRemoveRows()
+        row = len(self._buf)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._buf.append(entry)
+        self.endInsertRows()
+
+
+class UserRowDelegate(QStyledItemDelegate):
+    """Paints a user row (UID, name, admin, edit and delete buttons) without any child widgets.
+
+    Clicks on the painted buttons come out as `edit_requested` / `delete_requested`
+    carrying the row's uid.
+    """
+    edit_requested = pyqtSignal(str)
+    delete_requested = pyqtSignal(str)
+
+    ROW_HEIGHT = 56
+    BUTTON_SIZE = 40
+    MARGIN = 8
+
+    def _button_rects(self, rect):
+        size, margin = self.BUTTON_SIZE, self.MARGIN
+        top = rect.top() + (rect.height() - size) // 2
+        delete_rect = QRect(rect.right() - margin - size, top, size, size)
+        edit_rect = QRect(delete_rect.left() - margin - size, top, size, size)
+        return edit_rect, delete_rect
+
+    def sizeHint(self, option, index):
+        return QSize(option.rect.width(), self.ROW_HEIGHT)
+
+    def paint(self, painter, option, index):
+        # Let the style draw the row background and selection, then the text and buttons on top
+        self.initStyleOption(option, index)
+        option.text = ""
+        style = option.widget.style() if option.widget else QApplication.style()
+        style.drawControl(QStyle.CE_ItemViewItem, option, painter, option.widget)
+
+        user = index.data(Qt.UserRole)
+        edit_rect, delete_rect = self._button_rects(option.rect)
+        text_rect = option.rect.adjusted(self.MARGIN, 0, 0, 0)
+        text_rect.setRight(edit_rect.left() - self.MARGIN)
+        column = text_rect.width() // 3
+
+        painter.save()
+        painter.setPen(option.palette.color(QPalette.Text))
+        for i, text in enumerate((f"UID: {user['uid']}", f"Name: {user['name']}",
+                                  f"Admin: {'Yes' if user['isAdmin'] else 'No'}")):
+            cell = QRect(text_rect.left() + i * column, text_rect.top(), column, text_rect.height())
+            painter.drawText(cell, Qt.AlignLeft | Qt.AlignVCenter,
+                             option.fontMetrics.elidedText(text, Qt.ElideRight, cell.width()))
+        for rect, glyph in ((edit_rect, "✎"), (delete_rect, "🗑")):
+            painter.fillRect(rect, option.palette.color(QPalette.Button))
+            painter.drawText(rect, Qt.AlignCenter, glyph)
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        if event.type() == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton:
+            edit_rect, delete_rect = self._button_rects(option.rect)
+            uid = index.data(Qt.UserRole)['uid']
+            if edit_rect.contains(event.pos()):
+                self.edit_requested.emit(uid)
+                return True
+            if delete_rect.contains(event.pos()):
+                self.delete_requested.emit(uid)
+                return True
+        return super().editorEvent(event, model, option, index)
+
+
 class GateWiseUI(QWidget):
     def __init__(self):
         super().__init__()
         self.config = config
+        # Read once; checked on every garage event and screen build
+        self._garage_enabled = bool(self.config.garage_enabled)
         self.setWindowTitle(self.config.app_title)
         self.setGeometry(100, 100, self.config.window_width, self.config.window_height)
 
         self.primary_color = self.config.primary_color
-        self.logo_path = os.path.join(os.path.dirname(__file__), "..", "resources", "icons", "Gatewise.PNG")
+        self.logo_path = os.path.join(ICON_DIR, "Gatewise.PNG")
         self.setWindowTitle("Home Access Control")
         self.setGeometry(100, 100, 800, 480)
 
         self.primary_color = "#2c3e50"  # Neutral dark blue-gray for home
-        self.logs_icon_path = os.path.join(os.path.dirname(__file__), "..", "resources", "icons", "logs-white.png")
-        self.settings_icon_path = os.path.join(os.path.dirname(__file__), "..", "resources", "icons", "config_white.png")
-        self.unlock_icon_path = os.path.join(os.path.dirname(__file__), "..", "resources", "icons", "unlock_white.png")
-        self.lock_icon_path = os.path.join(os.path.dirname(__file__), "..", "resources", "icons", "lock_white.png")
-
-        self.setStyleSheet(f"background-color: {self.primary_color}; color: white;")
+        self.logs_icon_path = os.path.join(ICON_DIR, "logs-white.png")
+        self.settings_icon_path = os.path.join(ICON_DIR, "config_white.png")
+        self.unlock_icon_path = os.path.join(ICON_DIR, "unlock_white.png")
+        self.lock_icon_path = os.path.join(ICON_DIR, "lock_white.png")
+
+        # Resolve icons once per process; a missing file yields an empty QIcon
+        self._icons = {}
+        for name, path in (("logs", self.logs_icon_path), ("settings", self.settings_icon_path),
+                           ("unlock", self.unlock_icon_path), ("lock", self.lock_icon_path)):
+            self._icons[name] = _cached_icon(path)
+
+        QApplication.instance().setStyleSheet(_app_stylesheet(self.primary_color))
         
         # Admin password from environment variable
         self.admin_password = os.environ.get("GATEWISE_ADMIN_PASSWORD", "admin")
+        # time.monotonic() until which the admin password doesn't need re-entering
+        self._auth_expiry = 0.0
+
+        # Background door push worker, started on the first push (see push_to_door_modules)
+        self._push_thread = None
+        self._push_worker = None
+        # Start the shared RFID reader thread up front so the first scan is immediate
+        self._rfid_worker = get_rfid_worker()
+        # RFID log (see add_log_entry), kept even before the log screen is first shown
+        self.log_model = LogModel(parent=self)
+        # users.json is read off the GUI thread (see _on_users_loaded); touching
+        # self.users before that finishes falls back to a synchronous read
+        self._users = None
+        # Held until it reports so its signals object can't be collected mid-read
+        self._users_loader = JsonLoader(self.config.users_file, default=[])
+        self._users_loader.signals.loaded.connect(self._on_users_loaded)
+        QThreadPool.globalInstance().start(self._users_loader)
+        # Compact JSON of self.users, shared by save_users and push_to_door_modules
+        self._users_json_cache = None
+        # Auto-sync debounce: a burst of saves results in one push after the last edit
+        self._auto_sync_timer = QTimer(self)
+        self._auto_sync_timer.setSingleShot(True)
+        self._auto_sync_timer.setInterval(500)
+        self._auto_sync_timer.timeout.connect(self.push_to_door_modules)
+        # Save debounce: add/edit/delete mark the users dirty and one write follows the burst
+        self._users_dirty = False
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(500)
+        self._save_timer.timeout.connect(self._flush_users_save)
 
         # Initialize garage controller based on config
         self.garage_controller = None
-        if self.config.garage_enabled:
+        if self._garage_enabled:
             try:
                 from core.garage import GarageDoorController
                 self.garage_controller = GarageDoorController(event_callback=self._garage_event_callback)
@@ -184,38 +887,54 @@ class GateWiseUI(QWidget):
         main_layout = QVBoxLayout()
         self.setLayout(main_layout)
 
+        self.auto_sync_enabled = False
+
         self.stack = QStackedWidget()
         self.main_screen = QWidget()
-        self.settings_screen = QWidget()
-        self.log_screen = QWidget()
-        self.blackout_screen = QWidget()
-        self.user_screen = QWidget()
-        self.garage_screen = QWidget()
+        # Every other screen is built on first visit (see _ensure_screen)
+        self.settings_screen = None
+        self.log_screen = None
+        self.blackout_screen = None
+        self.user_screen = None
+        self.garage_screen = None
 
         self.init_main_screen()
-        self.init_settings_screen()
-        self.init_log_screen()
-        self.init_blackout_screen()
-        self.init_user_screen()
-        if self.config.garage_enabled:
-            self.init_garage_screen()
-
-        self.stack.addWidget(self.main_screen)
-        self.stack.addWidget(self.settings_screen)
-        self.stack.addWidget(self.log_screen)
-        self.stack.addWidget(self.blackout_screen)
-        self.stack.addWidget(self.user_screen)
-        if self.config.garage_enabled:
-            self.stack.addWidget(self.garage_screen)
+        # Stack index of each built screen, recorded as it is added
+        self._screen_index = {"main": self.stack.addWidget(self.main_screen)}
 
         main_layout.addWidget(self.stack)
+
+        # Non-modal status banner for quick confirmations (see flash_status)
+        self.status_banner = QLabel()
+        self.status_banner.setAlignment(Qt.AlignCenter)
+        self.status_banner.setProperty("role", "banner")
+        self.status_banner.hide()
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.timeout.connect(self._clear_status_banner)
+        main_layout.addWidget(self.status_banner)
+
         main_layout.addLayout(self.init_action_bar())
     
+    def _ensure_screen(self, name):
+        """Return `self.<name>_screen`, building it with `init_<name>_screen` on first use."""
+        screen = getattr(self, f"{name}_screen")
+        if screen is None:
+            screen = QWidget()
+            setattr(self, f"{name}_screen", screen)
+            getattr(self, f"init_{name}_screen")()
+            self._screen_index[name] = self.stack.addWidget(screen)
+        return screen
+
+    def _show_screen(self, name):
+        self._ensure_screen(name)
+        self.stack.setCurrentIndex(self._screen_index[name])
+
     def _garage_event_callback(self, event_type: str, data):
         """Handle garage controller events."""
         print(f"[UI] Garage event: {event_type} - {data}")
         # Update garage UI if on garage screen
-        if self.config.garage_enabled and self.stack.currentWidget() == self.garage_screen:
+        if self._garage_enabled and self.stack.currentIndex() == self._screen_index.get("garage"):
             self.update_garage_status()
 
     def init_main_screen(self):
@@ -226,38 +945,36 @@ class GateWiseUI(QWidget):
         title_label = QLabel("Home Access Control")
         title_label.setAlignment(Qt.AlignCenter)
         title_label.setFont(QFont("Arial", 24, QFont.Bold))
-        title_label.setStyleSheet("padding: 20px;")
+        title_label.setProperty("role", "title")
         layout.addWidget(title_label)
 
         icons_layout = QGridLayout()
         icons_layout.setColumnStretch(0, 1)
         icons_layout.setColumnStretch(1, 1)
-        if self.config.garage_enabled:
+        if self._garage_enabled:
             icons_layout.setColumnStretch(2, 1)
         icons_layout.setRowStretch(0, 1)
 
         logs_icon = QPushButton()
-        if os.path.exists(self.logs_icon_path):
-            logs_icon.setIcon(QIcon(self.logs_icon_path))
+        logs_icon.setIcon(self._icons["logs"])
         logs_icon.setIconSize(QSize(128, 128))
-        logs_icon.setStyleSheet("background-color: transparent;")
+        logs_icon.setProperty("role", "icon")
         logs_icon.clicked.connect(self.show_logs)
         icons_layout.addWidget(logs_icon, 0, 0, alignment=Qt.AlignCenter)
 
         settings_icon = QPushButton()
-        if os.path.exists(self.settings_icon_path):
-            settings_icon.setIcon(QIcon(self.settings_icon_path))
+        settings_icon.setIcon(self._icons["settings"])
         settings_icon.setIconSize(QSize(128, 128))
-        settings_icon.setStyleSheet("background-color: transparent;")
+        settings_icon.setProperty("role", "icon")
         settings_icon.clicked.connect(self.request_password)
         icons_layout.addWidget(settings_icon, 0, 1, alignment=Qt.AlignCenter)
 
         # Add garage button if enabled
-        if self.config.garage_enabled:
+        if self._garage_enabled:
             garage_icon = QPushButton()
             garage_icon.setText("🚪")  # Garage door emoji as placeholder
             garage_icon.setFont(QFont("Arial", 48))
-            garage_icon.setStyleSheet("background-color: transparent; color: white;")
+            garage_icon.setProperty("role", "icon")
             garage_icon.clicked.connect(self.show_garage)
             garage_icon.setToolTip("Garage Control")
             icons_layout.addWidget(garage_icon, 0, 2, alignment=Qt.AlignCenter)
@@ -269,24 +986,22 @@ class GateWiseUI(QWidget):
         btn_layout.setSpacing(20)
 
         unlock_btn = QPushButton("Unlock Door")
-        if os.path.exists(self.unlock_icon_path):
-            unlock_btn.setIcon(QIcon(self.unlock_icon_path))
+        unlock_btn.setIcon(self._icons["unlock"])
         unlock_btn.setIconSize(QSize(32, 32))
         unlock_btn.clicked.connect(self.unlock_door)
 
         lock_btn = QPushButton("Lock Door")
-        if os.path.exists(self.lock_icon_path):
-            lock_btn.setIcon(QIcon(self.lock_icon_path))
+        lock_btn.setIcon(self._icons["lock"])
         lock_btn.setIconSize(QSize(32, 32))
         lock_btn.clicked.connect(self.lock_door)
 
         garage_btn = QPushButton("Garage")
-        garage_btn.setIcon(QIcon(self.settings_icon_path))  # Reuse settings icon for garage
+        garage_btn.setIcon(self._icons["settings"])  # Reuse settings icon for garage
         garage_btn.setIconSize(QSize(32, 32))
         garage_btn.clicked.connect(self.show_garage)
 
         for btn in (unlock_btn, lock_btn, garage_btn):
-            btn.setStyleSheet("background-color: #34495e; color: white; padding: 10px; border-radius: 10px; font-size: 14px;")
+            btn.setProperty("role", "action")
             btn.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
             btn_layout.addWidget(btn)
 
@@ -309,7 +1024,7 @@ class GateWiseUI(QWidget):
         garage_btn.clicked.connect(self.show_garage)
 
         for btn in (blackout_btn, user_btn, garage_btn):
-            btn.setStyleSheet("background-color: #34495e; color: white; font-size: 16px; padding: 12px;")
+            btn.setProperty("role", "menu")
             btn.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
             layout.addWidget(btn)
 
@@ -321,25 +1036,40 @@ class GateWiseUI(QWidget):
 
         self.class_duration_dropdown = QComboBox()
         self.class_duration_dropdown.addItems(["15 minutes", "30 minutes", "45 minutes", "60 minutes", "90 minutes"])
-        self.class_duration_dropdown.setStyleSheet("background-color: #1e1e1e; color: white; font-size: 14px; padding: 8px;")
+        self.class_duration_dropdown.setProperty("role", "field")
+        # Size from a fixed character count, not the current item, so the layout stays put
+        self.class_duration_dropdown.setSizeAdjustPolicy(QComboBox.AdjustToMinimumContentsLength)
+        self.class_duration_dropdown.setMinimumContentsLength(12)
         layout.addWidget(self.class_duration_dropdown)
 
         back_btn = QPushButton("Back")
         back_btn.clicked.connect(self.show_main)
-        back_btn.setStyleSheet("background-color: #7f8c8d; color: white; font-size: 14px; padding: 10px;")
+        back_btn.setProperty("role", "back")
         layout.addWidget(back_btn)
 
     def init_log_screen(self):
         layout = QVBoxLayout()
         self.log_screen.setLayout(layout)
         layout.addWidget(QLabel("RFID Entry Log"))
-        self.log_list = QListWidget()
-        layout.addWidget(self.log_list)
+        self.log_view = QListView()
+        self.log_view.setModel(self.log_model)
+        self.log_view.setUniformItemSizes(True)
+        self.log_view.scrollToBottom()
+        layout.addWidget(self.log_view)
 
         back_btn = QPushButton("Back")
         back_btn.clicked.connect(self.show_main)
         layout.addWidget(back_btn)
 
+    def add_log_entry(self, text):
+        """Append a timestamped line to the RFID log, following it only if the view is at the bottom."""
+        view = self.log_view if self.log_screen is not None else None
+        bar = view.verticalScrollBar() if view is not None else None
+        at_bottom = bar is None or bar.value() == bar.maximum()
+        self.log_model.append(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}  {text}")
+        if view is not None and at_bottom:
+            view.scrollToBottom()
+
     def init_blackout_screen(self):
         layout = QVBoxLayout()
         self.blackout_screen.setLayout(layout)
@@ -356,16 +1086,21 @@ class GateWiseUI(QWidget):
 
         self.blackout_blocks = {}
         self.block_layouts = {}
+        # Per-day [start_min, end_min] pairs, parallel to blackout_blocks and kept in sync
+        # with the time editors; _blackout_lookup is derived from it on demand
+        self._blackout_minutes = {}
+        self._blackout_lookup = None
 
         for day in ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]:
             group = QGroupBox(day)
-            group.setStyleSheet("QGroupBox { font-weight: bold; border: 1px solid #444; margin-top: 10px; padding: 10px; }")
+            group.setProperty("kind", "day")
             group_layout = QVBoxLayout()
             self.blackout_blocks[day] = []
+            self._blackout_minutes[day] = []
             self.block_layouts[day] = group_layout
 
             add_btn = QPushButton("Add Time Block")
-            add_btn.setStyleSheet("background-color: #2c3e50; color: white; font-size: 16px; padding: 8px;")
+            add_btn.setProperty("role", "secondary")
             add_btn.clicked.connect(lambda _, d=day: self.add_time_block(d))
 
             group_layout.addWidget(add_btn)
@@ -377,88 +1112,126 @@ class GateWiseUI(QWidget):
         layout.addWidget(scroll)
 
         save_btn = QPushButton("Save Schedule")
-        save_btn.setStyleSheet("background-color: #27ae60; color: white; font-size: 16px; padding: 10px;")
+        save_btn.setProperty("role", "success")
         save_btn.clicked.connect(self.save_blackout_schedule)
         layout.addWidget(save_btn)
 
         back_btn = QPushButton("Back")
-        back_btn.setStyleSheet("background-color: #7f8c8d; color: white; font-size: 16px; padding: 10px;")
-        back_btn.clicked.connect(lambda: self.stack.setCurrentWidget(self.settings_screen))
+        back_btn.setProperty("role", "back")
+        back_btn.clicked.connect(self.show_settings)
         layout.addWidget(back_btn)
 
         self.load_blackout_schedule()
 
     def add_time_block(self, day_name, start_str="04:00", end_str="10:00"):
+        self._ensure_screen("blackout")
         container = QWidget()
         layout = QHBoxLayout()
         layout.setContentsMargins(5, 5, 5, 5)
 
+        # Parse once in Python; the same minutes seed both the editors and _blackout_minutes
+        minutes = [_hhmm_to_minutes(start_str), _hhmm_to_minutes(end_str)]
+
+        # Format first, so setTime renders the text once rather than in the default format and again
         start_time = QTimeEdit()
-        start_time.setTime(QTime.fromString(start_str, "HH:mm"))
         start_time.setDisplayFormat("HH:mm")
-        start_time.setMinimumWidth(100)
-        start_time.setStyleSheet("font-size: 16px;")
+        start_time.setTime(QTime(*divmod(minutes[0], 60)))
+        start_time.setFixedWidth(100)
 
         end_time = QTimeEdit()
-        end_time.setTime(QTime.fromString(end_str, "HH:mm"))
         end_time.setDisplayFormat("HH:mm")
-        end_time.setMinimumWidth(100)
-        end_time.setStyleSheet("font-size: 16px;")
+        end_time.setTime(QTime(*divmod(minutes[1], 60)))
+        end_time.setFixedWidth(100)
 
         remove_btn = QPushButton("✕")
         remove_btn.setFixedSize(40, 40)
-        remove_btn.setStyleSheet("font-size: 18px; color: red; background: transparent;")
+        remove_btn.setProperty("role", "remove")
+
+        # Fixed-size rows: ticking a time editor shouldn't make the layout renegotiate geometry
+        start_label = QLabel("Start:")
+        start_label.setFixedSize(start_label.sizeHint())
+        end_label = QLabel("End:")
+        end_label.setFixedSize(end_label.sizeHint())
 
-        layout.addWidget(QLabel("Start:"))
+        layout.addWidget(start_label)
         layout.addWidget(start_time)
-        layout.addWidget(QLabel("End:"))
+        layout.addWidget(end_label)
         layout.addWidget(end_time)
         layout.addWidget(remove_btn)
         container.setLayout(layout)
         self.block_layouts[day_name].insertWidget(self.block_layouts[day_name].count() - 1, container)
 
         self.blackout_blocks[day_name].append((start_time, end_time, container))
+        self._blackout_minutes[day_name].append(minutes)
+        self._blackout_lookup = None
+
+        def set_minutes(index, t):
+            minutes[index] = t.hour() * 60 + t.minute()
+            self._blackout_lookup = None
 
         def remove_block():
             self.block_layouts[day_name].removeWidget(container)
-            container.setParent(None)
-            self.blackout_blocks[day_name].remove((start_time, end_time, container))
+            # Delete rather than just unparent: the connections to these closures keep
+            # an unparented row (and everything it captured) alive indefinitely
+            container.deleteLater()
+            index = self.blackout_blocks[day_name].index((start_time, end_time, container))
+            del self.blackout_blocks[day_name][index]
+            del self._blackout_minutes[day_name][index]
+            self._blackout_lookup = None
             # QMessageBox.information(self, "Removed", f"Block removed from {day_name}")
 
+        start_time.timeChanged.connect(lambda t: set_minutes(0, t))
+        end_time.timeChanged.connect(lambda t: set_minutes(1, t))
         remove_btn.clicked.connect(remove_block)
         # QMessageBox.information(self, "Added", f"Block added to {day_name}")
 
     def save_blackout_schedule(self):
-        data = {}
-        for day, blocks in self.blackout_blocks.items():
-            day_list = []
-            for start, end, _ in blocks:
-                day_list.append({
-                    "start": start.time().toString("HH:mm"),
-                    "end": end.time().toString("HH:mm")
-                })
-            data[day] = day_list
-
-        with open(self.config.blackout_file, "w") as f:
-            json.dump(data, f, indent=4)
-        QMessageBox.information(self, "Saved", "Blackout schedule saved successfully.")
+        # Load the schedule first so an unvisited screen can't overwrite the file with nothing
+        self._ensure_screen("blackout")
+        data = {
+            day: [{"start": _minutes_to_hhmm(start), "end": _minutes_to_hhmm(end)} for start, end in blocks]
+            for day, blocks in self._blackout_minutes.items()
+        }
+
+        _write_json_file(self.config.blackout_file, data, self.config.pretty_json)
+        self.flash_status("Blackout schedule saved.")
         # Navigate back to settings screen after saving
-        self.stack.setCurrentWidget(self.settings_screen)
+        self.show_settings()
+
+    def is_blackout(self, when=None):
+        """Return True if `when` (default: now) falls inside a blackout block."""
+        when = when or datetime.now()
+        self._ensure_screen("blackout")
+        if self._blackout_lookup is None:
+            self._blackout_lookup = _build_blackout_lookup(self._blackout_minutes)
+        starts, ends = self._blackout_lookup.get(when.strftime("%A"), ((), ()))
+        now_min = when.hour * 60 + when.minute
+        i = bisect.bisect_right(starts, now_min) - 1
+        return i >= 0 and now_min < ends[i]
 
     def load_blackout_schedule(self):
-        if not os.path.exists(self.config.blackout_file):
+        try:
+            data = _cached_json_load(self.config.blackout_file)
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            print(f"[ERROR] Failed to load blackout schedule: {e}")
             return
 
+        # Suspend painting so all blocks land in a single layout/paint pass
+        self.blackout_screen.setUpdatesEnabled(False)
         try:
-            with open(self.config.blackout_file, "r") as f:
-                data = json.load(f)
-
             for day, blocks in data.items():
                 if day in self.blackout_blocks:
                     for b in blocks:
                         self.add_time_block(day, b["start"], b["end"])
+            # Settle geometry for the inserted rows in one pass per day while painting is still off
+            for day_layout in self.block_layouts.values():
+                day_layout.activate()
         except Exception as e:
             print(f"[ERROR] Failed to load blackout schedule: {e}")
+        finally:
+            self.blackout_screen.setUpdatesEnabled(True)
 
     def init_garage_screen(self):
         """Initialize garage door control screen."""
@@ -472,7 +1245,7 @@ class GateWiseUI(QWidget):
 
         # Status display
         status_group = QGroupBox("Current Status")
-        status_group.setStyleSheet("QGroupBox { font-weight: bold; border: 2px solid #444; margin-top: 10px; padding: 15px; }")
+        status_group.setProperty("kind", "panel")
         status_layout = QVBoxLayout()
 
         self.garage_status_label = QLabel("Status: Unknown")
@@ -489,17 +1262,17 @@ class GateWiseUI(QWidget):
 
         # Control buttons
         control_group = QGroupBox("Controls")
-        control_group.setStyleSheet("QGroupBox { font-weight: bold; border: 2px solid #444; margin-top: 10px; padding: 15px; }")
+        control_group.setProperty("kind", "panel")
         control_layout = QVBoxLayout()
 
         self.garage_trigger_btn = QPushButton("Trigger Garage Door")
-        self.garage_trigger_btn.setStyleSheet("background-color: #e67e22; color: white; font-size: 18px; padding: 15px; font-weight: bold;")
+        self.garage_trigger_btn.setProperty("role", "garage")
         self.garage_trigger_btn.clicked.connect(self.trigger_garage_door)
         control_layout.addWidget(self.garage_trigger_btn)
 
         if self.config.garage_auto_close_seconds > 0:
             self.garage_cancel_auto_close_btn = QPushButton("Cancel Auto-Close")
-            self.garage_cancel_auto_close_btn.setStyleSheet("background-color: #c0392b; color: white; font-size: 14px; padding: 10px;")
+            self.garage_cancel_auto_close_btn.setProperty("role", "danger")
             self.garage_cancel_auto_close_btn.clicked.connect(self.cancel_auto_close)
             control_layout.addWidget(self.garage_cancel_auto_close_btn)
 
@@ -508,11 +1281,11 @@ class GateWiseUI(QWidget):
 
         # Recent events
         events_group = QGroupBox("Recent Activity")
-        events_group.setStyleSheet("QGroupBox { font-weight: bold; border: 2px solid #444; margin-top: 10px; padding: 10px; }")
+        events_group.setProperty("kind", "events")
         events_layout = QVBoxLayout()
 
         self.garage_events_list = QListWidget()
-        self.garage_events_list.setStyleSheet("background-color: #1e1e1e; color: white; font-size: 12px;")
+        self.garage_events_list.setProperty("role", "events")
         events_layout.addWidget(self.garage_events_list)
 
         events_group.setLayout(events_layout)
@@ -520,10 +1293,16 @@ class GateWiseUI(QWidget):
 
         # Back button
         back_btn = QPushButton("Back")
-        back_btn.setStyleSheet("background-color: #7f8c8d; color: white; font-size: 14px; padding: 10px;")
+        back_btn.setProperty("role", "back")
         back_btn.clicked.connect(self.show_main)
         layout.addWidget(back_btn)
 
+        # Last rendered (state, last_trigger_time, newest event seq) and formatted trigger time
+        self._last_garage_render = None
+        self._trigger_time_text = (None, "Never")
+        # Sequence number of the newest event already in garage_events_list
+        self._last_event_seq = 0
+
         # Initial status update
         self.update_garage_status()
 
@@ -533,20 +1312,32 @@ class GateWiseUI(QWidget):
             QMessageBox.warning(self, "Error", "Garage controller not available.")
             return
 
-        confirm = QMessageBox.question(
-            self,
-            "Confirm Action",
-            "Trigger the garage door?",
-            QMessageBox.Yes | QMessageBox.No
-        )
+        if self.config.garage_confirm:
+            confirm = QMessageBox.question(
+                self,
+                "Confirm Action",
+                "Trigger the garage door?",
+                QMessageBox.Yes | QMessageBox.No
+            )
+            if confirm != QMessageBox.Yes:
+                return
 
-        if confirm == QMessageBox.Yes:
-            success = self.garage_controller.trigger("ui")
-            if success:
-                QMessageBox.information(self, "Success", "Garage door triggered.")
-                self.update_garage_status()
-            else:
-                QMessageBox.warning(self, "Failed", "Failed to trigger garage door.")
+        success = self.garage_controller.trigger("ui")
+        if success:
+            self.flash_status("Garage door triggered.", 5000)
+            self.update_garage_status()
+        else:
+            QMessageBox.warning(self, "Failed", "Failed to trigger garage door.")
+
+    def flash_status(self, text, duration_ms=3000):
+        """Show `text` in the status banner for `duration_ms` without blocking the UI."""
+        self.status_banner.setText(text)
+        self.status_banner.show()
+        self._status_timer.start(duration_ms)
+
+    def _clear_status_banner(self):
+        self.status_banner.hide()
+        self.status_banner.clear()
 
     def cancel_auto_close(self):
         """Cancel scheduled auto-close."""
@@ -561,37 +1352,50 @@ class GateWiseUI(QWidget):
         if not self.garage_controller:
             return
 
-        # Update status label
         state = self.garage_controller.get_state()
-        state_colors = {
-            "open": "#e74c3c",
-            "closed": "#27ae60",
-            "opening": "#f39c12",
-            "closing": "#f39c12",
-            "unknown": "#95a5a6"
-        }
-        color = state_colors.get(state, "#95a5a6")
+        last_trigger_time = self.garage_controller.last_trigger_time
+        events = self.garage_controller.get_recent_events(20, with_seq=True)
+        newest_seq = events[-1][0] if events else 0
+
+        # Nothing to redraw if the controller reports what is already on screen
+        render_key = (state, last_trigger_time, newest_seq)
+        if render_key == self._last_garage_render:
+            return
+        self._last_garage_render = render_key
+
+        # Update status label; its colour comes from the QLabel[state=...] rules in APP_QSS
         self.garage_status_label.setText(f"Status: {state.upper()}")
-        self.garage_status_label.setStyleSheet(f"color: {color};")
+        if state not in ("open", "closed", "opening", "closing"):
+            state = "unknown"
+        self.garage_status_label.setProperty("state", state)
+        self.garage_status_label.style().unpolish(self.garage_status_label)
+        self.garage_status_label.style().polish(self.garage_status_label)
 
         # Update last trigger time
-        if self.garage_controller.last_trigger_time:
-            last_time = datetime.fromtimestamp(self.garage_controller.last_trigger_time)
-            self.garage_last_trigger_label.setText(f"Last triggered: {last_time.strftime('%Y-%m-%d %H:%M:%S')}")
-        else:
-            self.garage_last_trigger_label.setText("Last triggered: Never")
-
-        # Update events list
-        events = self.garage_controller.get_recent_events(20)
-        self.garage_events_list.clear()
-        for event in reversed(events):  # Show newest first
-            self.garage_events_list.addItem(event)
+        if self._trigger_time_text[0] != last_trigger_time:
+            text = datetime.fromtimestamp(last_trigger_time).strftime('%Y-%m-%d %H:%M:%S') if last_trigger_time else "Never"
+            self._trigger_time_text = (last_trigger_time, text)
+        self.garage_last_trigger_label.setText(f"Last triggered: {self._trigger_time_text[1]}")
+
+        # Update events list (newest first) by prepending only events it hasn't shown yet
+        if newest_seq < self._last_event_seq:
+            # The log was truncated or replaced; start over
+            self.garage_events_list.clear()
+            self._last_event_seq = 0
+        for seq, text in events:
+            if seq > self._last_event_seq:
+                self.garage_events_list.insertItem(0, text)
+        while self.garage_events_list.count() > 20:
+            self.garage_events_list.takeItem(20)
+        self._last_event_seq = newest_seq
 
     def show_garage(self):
         """Show garage control screen."""
-        if self.config.garage_enabled:
-            self.update_garage_status()
-            self.stack.setCurrentWidget(self.garage_screen)
+        if self._garage_enabled:
+            # A first visit builds the screen, which refreshes itself in init_garage_screen
+            if self.garage_screen is not None:
+                self.update_garage_status()
+            self._show_screen("garage")
         else:
             QMessageBox.information(self, "Not Available", "Garage control is not enabled.")
 
@@ -604,78 +1408,109 @@ class GateWiseUI(QWidget):
         title.setAlignment(Qt.AlignCenter)
         layout.addWidget(title)
 
-        self.user_list_widget = QVBoxLayout()
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll_content = QWidget()
-        scroll_content.setLayout(self.user_list_widget)
-        scroll.setWidget(scroll_content)
-        layout.addWidget(scroll)
+        # Rows are painted by UserRowDelegate, so the list holds no widgets per user
+        self.user_model = UserListModel(self)
+        self.user_list_view = QListView()
+        self.user_list_view.setModel(self.user_model)
+        self.user_list_view.setUniformItemSizes(True)
+        user_delegate = UserRowDelegate(self.user_list_view)
+        user_delegate.edit_requested.connect(self._on_edit_user_clicked)
+        user_delegate.delete_requested.connect(self._on_delete_user_clicked)
+        self.user_list_view.setItemDelegate(user_delegate)
+        layout.addWidget(self.user_list_view)
 
         buttons_layout = QHBoxLayout()
 
-        add_user_btn = QPushButton("Add User")
-        add_user_btn.setStyleSheet("background-color: #2980b9; color: white; font-size: 16px; padding: 10px;")
-        add_user_btn.clicked.connect(self.add_user_dialog)
-        buttons_layout.addWidget(add_user_btn)
+        self.add_user_btn = QPushButton("Add User")
+        self.add_user_btn.setProperty("role", "primary")
+        self.add_user_btn.clicked.connect(self.add_user_dialog)
+        buttons_layout.addWidget(self.add_user_btn)
 
         push_btn = QPushButton("Push to Doors")
-        push_btn.setStyleSheet("background-color: #27ae60; color: white; font-size: 16px; padding: 10px;")
+        push_btn.setProperty("role", "success")
         push_btn.clicked.connect(self.push_to_door_modules)
         buttons_layout.addWidget(push_btn)
 
         self.auto_sync_toggle = QCheckBox("Enable Auto-Sync")
-        self.auto_sync_toggle.setStyleSheet("color: white; font-size: 14px;")
+        self.auto_sync_toggle.setProperty("role", "toggle")
         self.auto_sync_toggle.setChecked(False)
         self.auto_sync_toggle.stateChanged.connect(self.toggle_auto_sync)
         self.auto_sync_enabled = False
         self.auto_sync_toggle.setChecked(False)
         self.auto_sync_toggle.stateChanged.connect(self.toggle_auto_sync)
-        self.auto_sync_toggle.setStyleSheet("font-size: 14px;")
         buttons_layout.addWidget(self.auto_sync_toggle)
 
         layout.addLayout(buttons_layout)
         
         back_btn = QPushButton("Back")
-        back_btn.clicked.connect(lambda: self.stack.setCurrentWidget(self.settings_screen))
-        back_btn.setStyleSheet("background-color: #7f8c8d; color: white; font-size: 14px; padding: 10px;")
+        back_btn.clicked.connect(self.show_settings)
+        back_btn.setProperty("role", "back")
         layout.addWidget(back_btn)
 
         self.auto_sync_enabled = False
-        self.load_users()
+        if self._users is None:
+            # Still loading; _on_users_loaded fills the list and re-enables adding
+            self.add_user_btn.setEnabled(False)
+        else:
+            self.refresh_user_list()
+
+    def _on_users_loaded(self, users):
+        self._users_loader = None
+        if self._users is None:
+            self.users = users
+        # else: already read synchronously (or assigned) in the meantime; that copy
+        # wins, but the screen built while loading still needs filling in
+        if self.user_screen is not None:
+            self.add_user_btn.setEnabled(True)
+        self.refresh_user_list()
+
+    def _ensure_users(self):
+        if self._users is None:
+            self.users = self._read_users_file()
+
+    @property
+    def users(self):
+        self._ensure_users()
+        return self._users
+
+    @users.setter
+    def users(self, users):
+        # Assigning the list rebuilds the uid index and drops the encoded copy;
+        # add/edit/delete keep both in step after that
+        self._users = users
+        self._users_by_uid = {u['uid']: u for u in users}
+        self._users_json_cache = None
+
+    def _read_users_file(self):
+        try:
+            return _cached_json_load(self.config.users_file)
+        except FileNotFoundError:
+            return []
 
     def load_users(self):
-        self.users = []
-        if os.path.exists(self.config.users_file):
-            with open(self.config.users_file, "r") as f:
-                self.users = json.load(f)
+        self.users = self._read_users_file()
         self.refresh_user_list()
 
     def refresh_user_list(self):
-        for i in reversed(range(self.user_list_widget.count())):
-            widget = self.user_list_widget.itemAt(i).widget()
-            if widget:
-                widget.setParent(None)
-
-        for user in self.users:
-            group = QGroupBox()
-            layout = QHBoxLayout()
-            layout.addWidget(QLabel(f"UID: {user['uid']}"))
-            layout.addWidget(QLabel(f"Name: {user['name']}"))
-            layout.addWidget(QLabel(f"Admin: {'Yes' if user['isAdmin'] else 'No'}"))
-
-            edit_btn = QPushButton("✎")
-            edit_btn.setFixedSize(40, 40)
-            edit_btn.clicked.connect(lambda _, u=user: self.edit_user_dialog(u))
-
-            del_btn = QPushButton("🗑")
-            del_btn.setFixedSize(40, 40)
-            del_btn.clicked.connect(lambda _, u=user: self.delete_user(u))
-
-            layout.addWidget(edit_btn)
-            layout.addWidget(del_btn)
-            group.setLayout(layout)
-            self.user_list_widget.addWidget(group)
+        """Bring the user list in line with `self.users`, only touching rows that changed."""
+        if self.user_screen is None:
+            # Not built yet; init_user_screen fills the list from self.users when it is
+            return
+        self.user_model.set_users(self.users)
+
+    def _user_for_uid(self, uid):
+        self._ensure_users()
+        return self._users_by_uid.get(uid)
+
+    def _on_edit_user_clicked(self, uid):
+        user = self._user_for_uid(uid)
+        if user is not None:
+            self.edit_user_dialog(user)
+
+    def _on_delete_user_clicked(self, uid):
+        user = self._user_for_uid(uid)
+        if user is not None:
+            self.delete_user(user)
 
     def add_user_dialog(self):
         dialog = UserDialog(self)
@@ -684,11 +1519,12 @@ class GateWiseUI(QWidget):
             if not new_user['uid'] or not new_user['name']:
                 QMessageBox.warning(self, "Invalid Input", "UID and Name are required.")
                 return
-            if any(u['uid'] == new_user['uid'] for u in self.users):
+            if self._user_for_uid(new_user['uid']) is not None:
                 QMessageBox.warning(self, "Duplicate UID", "A user with this UID already exists.")
                 return
             self.users.append(new_user)
-            self.save_users()
+            self._users_by_uid[new_user['uid']] = new_user
+            self._mark_users_dirty()
             self.refresh_user_list()
             QMessageBox.information(self, "Success", "User added successfully.")
 
@@ -696,28 +1532,49 @@ class GateWiseUI(QWidget):
         dialog = UserDialog(self, user=user)
         if dialog.exec_():
             updated_user = dialog.get_user()
-            for i, u in enumerate(self.users):
-                if u['uid'] == updated_user['uid']:
-                    self.users[i] = updated_user
-                    break
-            self.save_users()
+            existing = self._users_by_uid.get(updated_user['uid'])
+            if existing is not None:
+                # Update in place so the user keeps its position in the list
+                existing.update(updated_user)
+            self._mark_users_dirty()
             self.refresh_user_list()
             QMessageBox.information(self, "Success", "User updated successfully.")
 
     def delete_user(self, user):
         confirm = QMessageBox.question(self, "Confirm Delete", f"Delete user {user['name']}?")
         if confirm == QMessageBox.Yes:
-            self.users = [u for u in self.users if u['uid'] != user['uid']]
-            self.save_users()
+            removed = self._users_by_uid.pop(user['uid'], None)
+            if removed is not None:
+                self.users.remove(removed)
+            self._mark_users_dirty()
             self.refresh_user_list()
             QMessageBox.information(self, "Deleted", "User removed.")
 
+    def _mark_users_dirty(self):
+        """Schedule save_users for once edits settle; the encoded copy is stale right away."""
+        self._users_dirty = True
+        self._users_json_cache = None
+        self._save_timer.start()
+
+    def _flush_users_save(self):
+        if self._users_dirty:
+            self._users_dirty = False
+            self.save_users()
+
+    def _encoded_users(self):
+        """Compact JSON bytes of `self.users`, encoded once per change."""
+        if self._users_json_cache is None:
+            self._users_json_cache = _json_dumps_bytes(self.users)
+        return self._users_json_cache
+
     def save_users(self):
-        with open(self.config.users_file, "w") as f:
-            json.dump(self.users, f, indent=4)
+        if self.config.pretty_json:
+            _write_json_file(self.config.users_file, self.users)
+        else:
+            _write_json_file(self.config.users_file, self.users, pretty=False, encoded=self._encoded_users())
         if getattr(self, "auto_sync_enabled", False):
-            # trigger a non-blocking push so GUI stays responsive
-            self.push_to_door_modules()
+            # (re)start the debounce timer; the push happens once edits settle
+            self._auto_sync_timer.start()
 
     def toggle_auto_sync(self, state):
         """Enable/disable automatic syncing when user lists change."""
@@ -726,56 +1583,54 @@ class GateWiseUI(QWidget):
     def push_to_door_modules(self):
         """Send the current `self.users` to each door module.
 
-        This call is non-blocking: it spawns a background thread to perform network I/O.
-        The payload is JSON: {"users": [...]}
+        This call is non-blocking: network I/O runs in a `DoorPushWorker` on its own QThread.
+        The payload is JSON: {"users": [...]}, sent as one frame (see _frame_payload)
+        over a connection kept open between pushes. It is encoded here, so later edits
+        to `self.users` can't race the worker.
         """
-        users_payload = {
-            "users": self.users
-        }
-
-        def _worker(payload, hosts, port):
-            data = json.dumps(payload).encode("utf-8")
-            for host in hosts:
-                try:
-                    with socket.create_connection((host, port), timeout=5) as s:
-                        s.sendall(data)
-                        # optional small ACK read (non-blocking, best-effort)
-                        try:
-                            s.settimeout(1.0)
-                            _ = s.recv(1024)
-                        except Exception:
-                            pass
-                    print(f"[INFO] Pushed users to {host}:{port}")
-                except Exception as e:
-                    print(f"[WARN] Failed to push to {host}:{port} - {e}")
-
-        hosts = DOOR_MODULE_IPS.copy()
-        t = threading.Thread(target=_worker, args=(users_payload, hosts, DOOR_MODULE_PORT), daemon=True)
-        t.start()
+        frame = _frame_payload(b'{"users":' + self._encoded_users() + b'}')
+
+        if self._push_worker is None:
+            self._push_thread = QThread()
+            self._push_worker = DoorPushWorker(DOOR_MODULE_IPS, DOOR_MODULE_PORT)
+            self._push_worker.moveToThread(self._push_thread)
+            self._push_worker.finished.connect(self._on_push_done)
+            self._push_thread.start()
+        self._push_worker.submit(frame)
+
+    def _on_push_done(self, results):
+        """Report the outcome of a door push (runs on the GUI thread)."""
+        failed = [host for host, ok in results.items() if not ok]
+        if failed:
+            QMessageBox.warning(self, "Push Failed", f"Could not reach door module(s): {', '.join(failed)}")
 
     def request_password(self):
+        if time.monotonic() < self._auth_expiry:
+            self.show_settings()
+            return
         dlg = PasswordDialog(self)
         if dlg.exec_():
             entered_password = dlg.get_password()
-            if entered_password == self.config.admin_password:
+            if self.config.check_admin_password(entered_password):
+                self._auth_expiry = time.monotonic() + self.config.auth_session_minutes * 60
                 self.show_settings()
             else:
                 QMessageBox.warning(self, "Access Denied", "Incorrect password.")
 
     def show_main(self):
-        self.stack.setCurrentWidget(self.main_screen)
+        self.stack.setCurrentIndex(self._screen_index["main"])
 
     def show_logs(self):
-        self.stack.setCurrentWidget(self.log_screen)
+        self._show_screen("log")
 
     def show_settings(self):
-        self.stack.setCurrentWidget(self.settings_screen)
+        self._show_screen("settings")
 
     def show_blackout(self):
-        self.stack.setCurrentWidget(self.blackout_screen)
+        self._show_screen("blackout")
 
     def show_user_management(self):
-        self.stack.setCurrentWidget(self.user_screen)
+        self._show_screen("user")
     
     def unlock_door(self):
         """Unlock door action."""
@@ -796,6 +1651,15 @@ class GateWiseUI(QWidget):
     def closeEvent(self, event):
         """Handle window close event - clean up resources."""
         print("[UI] Closing application...")
+        # Write out any edits still waiting on the save debounce
+        self._save_timer.stop()
+        self._flush_users_save()
+        if self._push_thread is not None:
+            # Cancelling the push in flight lets the thread finish its current slot promptly
+            self._push_worker.stop()
+            self._push_thread.quit()
+            if _join_thread(self._push_thread, self._push_worker, 2000):
+                self._push_worker.close()
         if self.garage_controller:
             self.garage_controller.cleanup()
         event.accept()
@@ -803,6 +1667,7 @@ class GateWiseUI(QWidget):
 
 def launch_ui():
     app = QApplication(sys.argv)
+    QPixmapCache.setCacheLimit(PIXMAP_CACHE_LIMIT_KB)
     window = GateWiseUI()
     
     # Apply fullscreen if configured
@@ -6,8 +6,10 @@ This file mirrors core persistence and garage control logic from the original Py
 
 import os
 import json
+import hashlib
+import mmap
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from functools import partial
 
 from kivy.app import App
 from kivy.lang import Builder
@@ -20,9 +22,78 @@ from kivy.uix.textinput import TextInput
 from kivy.uix.scrollview import ScrollView
 from kivy.uix.popup import Popup
 from kivy.clock import Clock
+from kivy.properties import StringProperty
 
+from core.config import get_config
 from core.garage import GarageController
 
+# orjson is optional; it parses and encodes several times faster than the stdlib json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_loads_bytes(raw):
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+# Below this size a plain read beats setting up a mapping
+_MMAP_MIN_BYTES = 4096
+
+
+def _json_digest(data):
+    """Short fingerprint of encoded JSON, used to skip rewriting unchanged files."""
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def _read_json_file(path):
+    """Parse the JSON file at `path` and return (data, digest of its bytes).
+
+    Larger files are memory-mapped and parsed in place by orjson, so the
+    contents are never copied into a Python bytes object.
+    """
+    with open(path, 'rb') as f:
+        if orjson is not None and os.fstat(f.fileno()).st_size >= _MMAP_MIN_BYTES:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                view = memoryview(mm)
+                try:
+                    return orjson.loads(view), _json_digest(view)
+                finally:
+                    view.release()
+        raw = f.read()
+    return _json_loads_bytes(raw), _json_digest(raw)
+
+
+def _json_dumps_bytes(obj):
+    """Compact UTF-8 JSON: no indentation or spaces, for files nobody edits by hand."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+def _json_dumps_pretty(obj):
+    """Two-space indented UTF-8 JSON, the layout orjson supports natively."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode('utf-8')
+
+
+# Text accepted as "yes" in the isAdmin field
+_TRUTHY = frozenset({'1', 'true', 'yes', 'y', 'on'})
+
+
+def _atomic_write(path, data):
+    """Write `data` beside `path` and rename it over, so readers never see half a file."""
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
 KV = """
 <MainScreen>:
     name: 'main'
@@ -74,6 +145,23 @@ KV = """
                 height: '120dp'
                 on_release: app.show_screen('settings')
 
+<UserRow>:
+    size_hint_y: None
+    height: 40
+    Label:
+        text: root.row_text
+        color: 1,1,1,1
+    Button:
+        text: 'Edit'
+        size_hint_x: None
+        width: 80
+        on_release: app.open_edit_user_by_uid(root.user_uid)
+    Button:
+        text: 'Delete'
+        size_hint_x: None
+        width: 80
+        on_release: app.delete_user_by_uid(root.user_uid)
+
 <UsersScreen>:
     name: 'users'
     BoxLayout:
@@ -93,11 +181,14 @@ KV = """
                 color: 1,1,1,1
         BoxLayout:
             orientation: 'vertical'
-            ScrollView:
+            RecycleView:
+                id: users_rv
+                viewclass: 'UserRow'
                 do_scroll_x: False
-                BoxLayout:
-                    id: users_container
+                RecycleBoxLayout:
                     orientation: 'vertical'
+                    default_size: None, 40
+                    default_size_hint: 1, None
                     size_hint_y: None
                     height: self.minimum_height
             BoxLayout:
@@ -127,10 +218,14 @@ KV = """
             Label:
                 text: 'Blackout Schedule'
                 color: 1,1,1,1
-        ScrollView:
-            BoxLayout:
-                id: blackout_container
+        RecycleView:
+            id: blackout_rv
+            viewclass: 'Label'
+            do_scroll_x: False
+            RecycleBoxLayout:
                 orientation: 'vertical'
+                default_size: None, 40
+                default_size_hint: 1, None
                 size_hint_y: None
                 height: self.minimum_height
         BoxLayout:
@@ -201,6 +296,21 @@ KV = """
 """
 
 
+def _user_row(user):
+    """RecycleView data for one user; kept apart from the user dict so it never reaches users.json."""
+    return {'user_uid': user['uid'], 'row_text': f"{user['uid']} - {user['name']}"}
+
+
+class UserRow(BoxLayout):
+    """One recycled row of the users list; RecycleView fills these from `rv.data`.
+
+    Its buttons hand the row's uid to the app, which finds the user in its uid index.
+    """
+    # Not `uid`/`name`: Kivy widgets already use `uid` for their own id
+    user_uid = StringProperty('')
+    row_text = StringProperty('')
+
+
 class MainScreen(Screen):
     pass
 
@@ -221,9 +331,12 @@ class GarageScreen(Screen):
     pass
 
 
+# Parsed once per process at import; every app instance reuses the compiled rules
+Builder.load_string(KV)
+
+
 class GateWiseKivyApp(App):
     def build(self):
-        Builder.load_string(KV)
         self.sm = ScreenManager(transition=FadeTransition())
         self.sm.add_widget(MainScreen(name='main'))
         self.sm.add_widget(UsersScreen(name='users'))
@@ -231,9 +344,37 @@ class GateWiseKivyApp(App):
         self.sm.add_widget(SettingsScreen(name='settings'))
         self.sm.add_widget(GarageScreen(name='garage'))
 
+        # Widgets the refresh paths touch, resolved once instead of per call
+        self._users_rv = self.sm.get_screen('users').ids.users_rv
+        self._blackout_rv = self.sm.get_screen('blackout').ids.blackout_rv
+        garage_ids = self.sm.get_screen('garage').ids
+        self._garage_label = garage_ids.garage_state_label
+        self._garage_events = garage_ids.garage_events
+        # What the garage screen currently shows, so unchanged polls skip the redraw
+        self._last_state = None
+        # Log line number of the newest event shown, and the event labels oldest first
+        self._last_event_seq = 0
+        self._event_labels = []
+
         # State
         self.users = []
+        # uid -> the same dict as in self.users; add/edit/delete keep the two in step
+        self._users_by_uid = {}
+        # uid -> RecycleView data for that user's row, formatted when the user changes
+        self._user_rows = {}
+        # Add/Edit User popup, see _get_user_popup; _editing_uid is None while adding
+        self._user_popup = None
+        self._editing_uid = None
         self.blackout = {}
+        # Saves are encoded on the UI thread and written by this single worker, in order
+        self._io_executor = ThreadPoolExecutor(max_workers=1)
+        # PRETTY_JSON=false drops the indentation, shared with the PyQt UI's setting
+        self._pretty_json = get_config().pretty_json
+        # path -> digest of what was last read from or queued for that file; identical saves are skipped
+        self._saved_json = {}
+        # A burst of saves collapses into one write 0.25 s after the last of them
+        self._save_users_trigger = Clock.create_trigger(self._do_save_users, 0.25)
+        self._save_blackout_trigger = Clock.create_trigger(self._do_save_blackout, 0.25)
 
         # Garage controller integration
         try:
@@ -242,101 +383,170 @@ class GateWiseKivyApp(App):
             print(f"[WARN] Garage controller unavailable: {e}")
             self.garage = None
 
-        # Load persisted data
-        Clock.schedule_once(lambda dt: self.load_users(), 0.1)
-        Clock.schedule_once(lambda dt: self.load_blackout(), 0.1)
-        Clock.schedule_interval(lambda dt: self.refresh_garage_state(), 2.0)
+        # The garage screen refreshes when something happens rather than on a
+        # fast poll. Triggers are safe to fire from the controller's GPIO
+        # thread and coalesce into one refresh on the next frame.
+        self._garage_refresh_trigger = Clock.create_trigger(lambda dt: self.refresh_garage_state(), 0)
+        if self.garage and hasattr(self.garage, 'set_button_callback'):
+            self.garage.set_button_callback(self._garage_refresh_trigger)
+
+        # Slow watchdog for changes that don't come through a callback (e.g. a remote
+        # opener); it only runs while the garage screen is showing
+        self._garage_watchdog = None
+        self.sm.bind(current=self._on_screen_change)
 
         return self.sm
 
+    def on_start(self):
+        # The widget tree exists by now, so persisted data can go straight into it
+        self.load_users()
+        self.load_blackout()
+
+    def on_stop(self):
+        # Write out saves still waiting on their debounce, then let every queued
+        # write reach the disk before the process exits
+        for trigger, save in ((self._save_users_trigger, self._do_save_users),
+                              (self._save_blackout_trigger, self._do_save_blackout)):
+            if trigger.is_triggered:
+                trigger.cancel()
+                save()
+        self._io_executor.shutdown(wait=True)
+
+    def _save_json(self, path, obj):
+        """Encode `obj` now and write it to `path` in the background, unless the file already holds it."""
+        data = _json_dumps_pretty(obj) if self._pretty_json else _json_dumps_bytes(obj)
+        digest = _json_digest(data)
+        if self._saved_json.get(path) == digest:
+            return
+        self._saved_json[path] = digest
+        future = self._io_executor.submit(_atomic_write, path, data)
+        future.add_done_callback(lambda f: Clock.schedule_once(lambda dt: self._on_saved(path, f)))
+
+    def _on_saved(self, path, future):
+        error = future.exception()
+        if error is not None:
+            print(f"[ERROR] Failed to save {path}: {error}")
+            # Disk contents are unknown now, so the next save must not be skipped
+            self._saved_json.pop(path, None)
+        else:
+            print(f"[INFO] {path} saved")
+
     def show_screen(self, name: str):
         self.sm.current = name
 
+    def _on_screen_change(self, sm, current):
+        if current == 'garage':
+            # Catch up on anything that happened while the screen was hidden
+            self._garage_refresh_trigger()
+            if self._garage_watchdog is None:
+                self._garage_watchdog = Clock.schedule_interval(lambda dt: self.refresh_garage_state(), 10.0)
+        elif self._garage_watchdog is not None:
+            self._garage_watchdog.cancel()
+            self._garage_watchdog = None
+
     # --- Users ---
     def load_users(self):
         if os.path.exists('users.json'):
             try:
-                with open('users.json', 'r') as f:
-                    self.users = json.load(f)
+                self.users, self._saved_json['users.json'] = _read_json_file('users.json')
             except Exception as e:
                 print(f"[ERROR] Failed to load users.json: {e}")
+        self._users_by_uid = {u['uid']: u for u in self.users}
+        self._user_rows = {u['uid']: _user_row(u) for u in self.users}
         self.refresh_users_ui()
 
     def save_users(self):
-        try:
-            with open('users.json', 'w') as f:
-                json.dump(self.users, f, indent=4)
-            print('[INFO] Users saved')
-        except Exception as e:
-            print(f"[ERROR] Failed to save users.json: {e}")
+        self._save_users_trigger()
+
+    def _do_save_users(self, *args):
+        self._save_json('users.json', self.users)
         # push to doors if auto-sync - simple behavior: always push for now
         # self.push_to_doors()
 
     def refresh_users_ui(self):
-        container = self.root.get_screen('users').ids.users_container
-        container.clear_widgets()
-        for u in self.users:
-            row = BoxLayout(size_hint_y=None, height=40)
-            row.add_widget(Label(text=f"{u['uid']} - {u['name']}", color=(1,1,1,1)))
-            btn_edit = Button(text='Edit', size_hint_x=None, width=80)
-            btn_edit.bind(on_release=partial(self.open_edit_user, u))
-            row.add_widget(btn_edit)
-            btn_del = Button(text='Delete', size_hint_x=None, width=80)
-            btn_del.bind(on_release=partial(self.delete_user, u))
-            row.add_widget(btn_del)
-            container.add_widget(row)
+        # RecycleView only builds rows for what is on screen and reuses them while scrolling
+        self._users_rv.data = [self._user_rows[u['uid']] for u in self.users]
+
+    def _get_user_popup(self):
+        """The Add/Edit User popup, built on first use and reused for every open after that."""
+        if self._user_popup is None:
+            content = BoxLayout(orientation='vertical', spacing=8, padding=8)
+            self._user_uid_in = TextInput(hint_text='UID')
+            self._user_name_in = TextInput(hint_text='Name')
+            self._user_admin_in = TextInput(hint_text='isAdmin (true/false)')
+            content.add_widget(self._user_uid_in)
+            content.add_widget(self._user_name_in)
+            content.add_widget(self._user_admin_in)
+            self._user_popup_btn = Button(size_hint_y=None, height=40)
+            self._user_popup_btn.bind(on_release=self._submit_user_popup)
+            content.add_widget(self._user_popup_btn)
+            self._user_popup = Popup(content=content, size_hint=(0.8, 0.5))
+        return self._user_popup
 
     def open_add_user(self, *args):
-        content = BoxLayout(orientation='vertical', spacing=8, padding=8)
-        uid_in = TextInput(hint_text='UID')
-        name_in = TextInput(hint_text='Name')
-        admin_in = TextInput(hint_text='isAdmin (true/false)')
-        content.add_widget(uid_in)
-        content.add_widget(name_in)
-        content.add_widget(admin_in)
-        btn = Button(text='Add', size_hint_y=None, height=40)
-
-        def do_add(_):
-            uid = uid_in.text.strip()
-            name = name_in.text.strip()
-            is_admin = admin_in.text.strip().lower() in ('1','true','yes')
-            if not uid or not name:
-                return
-            if any(x['uid'] == uid for x in self.users):
-                return
-            self.users.append({'uid': uid, 'name': name, 'isAdmin': is_admin})
-            self.save_users()
-            self.refresh_users_ui()
-            popup.dismiss()
-
-        btn.bind(on_release=do_add)
-        content.add_widget(btn)
-        popup = Popup(title='Add User', content=content, size_hint=(0.8, 0.5))
+        popup = self._get_user_popup()
+        self._editing_uid = None
+        popup.title = 'Add User'
+        self._user_popup_btn.text = 'Add'
+        self._user_uid_in.text = ''
+        self._user_uid_in.disabled = False
+        self._user_name_in.text = ''
+        self._user_admin_in.text = ''
         popup.open()
 
     def open_edit_user(self, user, *args):
-        content = BoxLayout(orientation='vertical', spacing=8, padding=8)
-        name_in = TextInput(text=user['name'])
-        admin_in = TextInput(text=str(user['isAdmin']))
-        content.add_widget(Label(text=f"UID: {user['uid']}"))
-        content.add_widget(name_in)
-        content.add_widget(admin_in)
-        btn = Button(text='Save', size_hint_y=None, height=40)
-
-        def do_save(_):
-            user['name'] = name_in.text.strip()
-            user['isAdmin'] = admin_in.text.strip().lower() in ('1','true','yes')
-            self.save_users()
-            self.refresh_users_ui()
-            popup.dismiss()
-
-        btn.bind(on_release=do_save)
-        content.add_widget(btn)
-        popup = Popup(title='Edit User', content=content, size_hint=(0.8, 0.5))
+        popup = self._get_user_popup()
+        self._editing_uid = user['uid']
+        popup.title = 'Edit User'
+        self._user_popup_btn.text = 'Save'
+        # The uid identifies the user, so it is shown but can't be changed
+        self._user_uid_in.text = user['uid']
+        self._user_uid_in.disabled = True
+        self._user_name_in.text = user['name']
+        self._user_admin_in.text = str(user['isAdmin'])
         popup.open()
 
+    def _submit_user_popup(self, *args):
+        name = self._user_name_in.text.strip()
+        is_admin = self._user_admin_in.text.strip().lower() in _TRUTHY
+        if self._editing_uid is None:
+            uid = self._user_uid_in.text.strip()
+            if not uid or not name:
+                return
+            if uid in self._users_by_uid:
+                return
+            user = {'uid': uid, 'name': name, 'isAdmin': is_admin}
+            self.users.append(user)
+            self._users_by_uid[uid] = user
+        else:
+            user = self._users_by_uid.get(self._editing_uid)
+            if user is None:
+                # Deleted while the popup was open
+                self._user_popup.dismiss()
+                return
+            user['name'] = name
+            user['isAdmin'] = is_admin
+        self._user_rows[user['uid']] = _user_row(user)
+        self.save_users()
+        self.refresh_users_ui()
+        self._user_popup.dismiss()
+
+    def open_edit_user_by_uid(self, uid):
+        user = self._users_by_uid.get(uid)
+        if user is not None:
+            self.open_edit_user(user)
+
+    def delete_user_by_uid(self, uid):
+        user = self._users_by_uid.get(uid)
+        if user is not None:
+            self.delete_user(user)
+
     def delete_user(self, user, *args):
-        self.users = [u for u in self.users if u['uid'] != user['uid']]
+        existing = self._users_by_uid.pop(user['uid'], None)
+        if existing is None:
+            return
+        self.users.remove(existing)
+        del self._user_rows[existing['uid']]
         self.save_users()
         self.refresh_users_ui()
 
@@ -348,46 +558,57 @@ class GateWiseKivyApp(App):
     def load_blackout(self):
         if os.path.exists('blackout.json'):
             try:
-                with open('blackout.json', 'r') as f:
-                    self.blackout = json.load(f)
+                self.blackout, self._saved_json['blackout.json'] = _read_json_file('blackout.json')
             except Exception as e:
                 print(f"[ERROR] Failed to load blackout.json: {e}")
         self.refresh_blackout_ui()
 
     def refresh_blackout_ui(self):
-        container = self.root.get_screen('blackout').ids.blackout_container
-        container.clear_widgets()
-        for day, blocks in self.blackout.items():
-            for b in blocks:
-                row = BoxLayout(size_hint_y=None, height=40)
-                row.add_widget(Label(text=f"{day}: {b['start']} - {b['end']}", color=(1,1,1,1)))
-                container.add_widget(row)
+        self._blackout_rv.data = [{'text': f"{day}: {b['start']} - {b['end']}"}
+                                  for day, blocks in self.blackout.items() for b in blocks]
 
     def save_blackout(self):
-        try:
-            with open('blackout.json', 'w') as f:
-                json.dump(self.blackout, f, indent=4)
-            print('[INFO] blackout saved')
-        except Exception as e:
-            print(f"[ERROR] Failed to save blackout.json: {e}")
+        self._save_blackout_trigger()
+
+    def _do_save_blackout(self, *args):
+        self._save_json('blackout.json', self.blackout)
 
     # --- Garage ---
     def refresh_garage_state(self):
-        screen = self.root.get_screen('garage')
-        label = screen.ids.garage_state_label
+        # Hidden widgets don't need updating; entering the screen refreshes it
+        if self.sm.current != 'garage':
+            return
         if self.garage:
             state = self.garage.get_state() if hasattr(self.garage, 'get_state') else 'unknown'
-            label.text = f"State: {state}"
-            events = self.garage.get_recent_events() if hasattr(self.garage, 'get_recent_events') else []
-            ev_container = screen.ids.garage_events
-            ev_container.clear_widgets()
-            for e in events:
-                ev_container.add_widget(Label(text=e, size_hint_y=None, height=30, color=(1,1,1,1)))
+            events = self.garage.get_recent_events(with_seq=True) if hasattr(self.garage, 'get_recent_events') else []
+            newest_seq = events[-1][0] if events else 0
+            if state != self._last_state:
+                self._garage_label.text = f"State: {state}"
+                self._last_state = state
+            if newest_seq == self._last_event_seq:
+                return
+            ev_container = self._garage_events
+            if newest_seq < self._last_event_seq:
+                # The log was truncated or replaced; start over
+                ev_container.clear_widgets()
+                self._event_labels.clear()
+                self._last_event_seq = 0
+            # Append labels for events not shown yet, then drop the oldest ones
+            # that slid out of the window the log returns
+            for seq, text in events:
+                if seq > self._last_event_seq:
+                    label = Label(text=text, size_hint_y=None, height=30, color=(1,1,1,1))
+                    ev_container.add_widget(label)
+                    self._event_labels.append(label)
+            while len(self._event_labels) > len(events):
+                ev_container.remove_widget(self._event_labels.pop(0))
+            self._last_event_seq = newest_seq
 
     def trigger_garage(self):
         if self.garage:
             ok = self.garage.trigger('ui') if hasattr(self.garage, 'trigger') else False
             print(f"[GARAGE] Trigger result: {ok}")
+            self._garage_refresh_trigger()
         else:
             print('[GARAGE] No garage controller available')
 